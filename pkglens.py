@@ -8,9 +8,14 @@ Usage:
   python3 pkg_dashboard.py --port 0  # pick a random ephemeral port when serving
 """
 import argparse
+import contextlib
+import functools
+import hashlib
 import importlib
 import json
 import os
+import queue
+import re
 import shutil
 import socket
 import subprocess
@@ -18,20 +23,199 @@ import sys
 import tempfile
 import threading
 import time
-import webbrowser
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 HERE = Path(__file__).resolve().parent
 OUT_DIR = HERE / ".pkg_dashboard_build"
 OUT_DIR.mkdir(exist_ok=True)
 HTML_PATH = OUT_DIR / "index.html"
 DATA_PATH = OUT_DIR / "packages.json"
-HISTORY_PATH = OUT_DIR / "uninstall_history.json"
+HISTORY_PATH = OUT_DIR / "uninstall_history.jsonl"  # one JSON object per line
+LEGACY_HISTORY_PATH = OUT_DIR / "uninstall_history.json"
 PREVIOUS_PACKAGES_PATH = OUT_DIR / "previous_packages.json"
 VERIFICATION_STATUS_PATH = OUT_DIR / "verification_status.json"
+CONFLICTS_CACHE_PATH = OUT_DIR / "conflicts_cache.json"
+
+_print_lock = threading.Lock()
+
+def _dumps(obj, indent=True):
+    """Serialize to JSON bytes (indented by default), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def _loads(data):
+    """Parse JSON from bytes, str or a memoryview, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+# os.umask() can only be read by setting it; do that once, before any threads start
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_json_cache = {}  # path -> ((mtime_ns, size, inode), parsed object)
+_json_cache_lock = threading.Lock()
+
+def _loads_lines(data):
+    """Parse JSON Lines (one JSON object per line) into a list.
+
+    Lines that do not parse, such as a write torn by a crash, are skipped so
+    one bad line cannot hide (or, once rewritten, lose) the rest of the file.
+    """
+    out = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            obj = _loads(line)
+        except ValueError:
+            continue
+        if isinstance(obj, dict):
+            out.append(obj)
+    return out
+
+def _load_json_cached(path, default, parse=_loads):
+    """Parse a JSON file, reusing the last parse while the file is unchanged.
+
+    Lists and dicts are returned as shallow copies so callers may add, remove
+    or replace entries without touching the cached object.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return default
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _json_cache_lock:
+        hit = _json_cache.get(path)
+    if hit is not None and hit[0] == key:
+        obj = hit[1]
+    else:
+        obj = parse(path.read_bytes())
+        with _json_cache_lock:
+            _json_cache[path] = (key, obj)
+    return obj.copy() if isinstance(obj, (list, dict)) else obj
+
+def _write_json_atomic(path, obj):
+    """Write obj as JSON to path atomically; skip the write if nothing changed."""
+    return _write_bytes_atomic(path, _dumps(obj))
+
+def _write_bytes_atomic(path, payload):
+    """Write payload to path atomically; skip the write if nothing changed.
+
+    A "<name>.hash" sidecar records the digest of the last payload together
+    with the size/mtime it produced, so a no-op save costs one stat and one
+    small read, and a file changed by anything else is always rewritten.
+    """
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    sig_path = path.with_name(path.name + ".hash")
+    mode = 0o666 & ~_UMASK  # what a plain open() would create
+    try:
+        st = path.stat()
+        mode = st.st_mode & 0o7777
+        if sig_path.read_text(encoding="utf-8") == f"{digest} {st.st_size} {st.st_mtime_ns}":
+            return False
+    except OSError:
+        pass
+    # Drop the old signature first: a crash below must not leave one behind
+    # that matches content which never made it to disk.
+    try:
+        sig_path.unlink()
+    except OSError:
+        pass
+    with tempfile.NamedTemporaryFile("wb", dir=str(path.parent), prefix=path.name + ".",
+                                     suffix=".tmp", delete=False) as f:
+        f.write(payload)
+    try:
+        # NamedTemporaryFile creates the file 0600 and os.replace keeps that
+        os.chmod(f.name, mode)
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+    with _json_cache_lock:
+        _json_cache.pop(path, None)
+    st = path.stat()
+    sig_path.write_text(f"{digest} {st.st_size} {st.st_mtime_ns}", encoding="utf-8")
+    return True
+
+def _init_if_missing(path, payload):
+    """Create path with payload unless it already exists, in one race-free open."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
+    return True
+
+class DaemonThreadPool:
+    """A small executor whose worker threads are daemons.
+
+    concurrent.futures joins its workers at interpreter exit, so a single
+    long task (an idle keep-alive connection, a slow package check) would
+    keep Ctrl-C from exiting. Workers are started on demand up to max_workers.
+    """
+
+    def __init__(self, max_workers, name):
+        self.max_workers = max_workers
+        self.name = name
+        self._tasks = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._idle = 0
+
+    def submit(self, fn, *args):
+        future = Future()
+        with self._lock:
+            self._tasks.put((future, fn, args))
+            if self._idle == 0 and self._threads < self.max_workers:
+                self._threads += 1
+                threading.Thread(target=self._worker, daemon=True,
+                                 name=f"{self.name}-{self._threads}").start()
+        return future
+
+    def saturated(self):
+        """True when every worker is busy, so new tasks have to wait."""
+        with self._lock:
+            return self._idle == 0 and self._threads >= self.max_workers
+
+    def shutdown(self):
+        """Let the workers exit once they are done with queued tasks."""
+        with self._lock:
+            for _ in range(self._threads):
+                self._tasks.put(None)
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                self._idle += 1
+            task = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+                if task is None:
+                    self._threads -= 1
+                    return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
 def norm(v):
     """Normalize values to clean strings for display/hash keys."""
@@ -47,57 +231,92 @@ def norm(v):
     except Exception:
         return ""
 
+def _fast_norm(v):
+    """norm() that skips the type dispatch for values that are already str."""
+    return v if type(v) is str else norm(v)
+
 def cmd_exists(name: str) -> bool:
     return shutil.which(name) is not None
 
 def print_progress(message):
     """Print progress message with timestamp."""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
+    # gatherers run concurrently in collect_all(); keep lines from interleaving
+    with _print_lock:
+        print(f"[{timestamp}] {message}")
 
-def run_cmd(cmd, timeout=60):
+def run_cmd_bytes(cmd, timeout=60):
+    """Run a command and return its raw output (b"" on failure).
+
+    Use this for commands whose output goes straight into _loads(); JSON can
+    be parsed from bytes without a separate decode pass.
+    """
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, timeout=timeout)
-        return out.decode("utf-8", errors="replace")
+        return subprocess.check_output(cmd, stderr=subprocess.STDOUT, timeout=timeout)
     except Exception:
-        return ""
+        return b""
 
-def print_progress(message):
-    """Print progress message with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
+def run_cmd(cmd, timeout=60):
+    return run_cmd_bytes(cmd, timeout=timeout).decode("utf-8", errors="replace")
 
 def get_directory_size(path):
     """Calculate directory size in bytes."""
-    try:
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total_size += os.path.getsize(filepath)
-        return total_size
-    except Exception:
-        return 0
+    # Resolve symlinks first so e.g. brew's opt/<name> and Cellar/<name> share
+    # one cache entry and every directory is walked once per scan.
+    return _dir_size_cached(os.path.realpath(path))
+
+@functools.lru_cache(maxsize=None)
+def _dir_size_cached(path):
+    """Sum file sizes under an already-resolved directory path."""
+    # os.scandir hands back DirEntry objects whose type/stat info comes from
+    # readdir, so each file costs one stat at most (os.walk + getsize did two).
+    total_size = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            # unreadable or vanished directory
+            pass
+    return total_size
 
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes):
     """Format bytes into human readable format."""
     if size_bytes == 0:
         return "0 B"
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    return f"{size_bytes:.1f} {size_names[i]}"
+    size_names = ("B", "KB", "MB", "GB", "TB")
+    # each unit is 2**10 of the previous one, so the bit length picks it directly
+    i = min(len(size_names) - 1, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (10 * i)):.1f} {size_names[i]}"
+
+@functools.lru_cache(maxsize=1)
+def _get_npm_prefix():
+    """Global npm prefix, looked up once per process."""
+    return run_cmd(["npm", "config", "get", "prefix"]).strip()
+
+@functools.lru_cache(maxsize=1)
+def _get_brew_prefix():
+    """Homebrew prefix, looked up once per process."""
+    return run_cmd(["brew", "--prefix"]).strip()
 
 def get_package_size(manager, name, path):
     """Get package size based on manager type."""
     try:
+        # Gatherers fill in the install directory wherever they know it
+        # (including brew's opt/Cellar paths), so sizing is a directory walk.
+        if path and os.path.exists(path):
+            return get_directory_size(path)
         if manager == "pip (this Python)" or manager.startswith("pip"):
-            # For pip packages, calculate size of the package directory
-            if path and os.path.exists(path):
-                return get_directory_size(path)
             # Try to find package location
             try:
                 if sys.version_info >= (3, 8):
@@ -105,30 +324,15 @@ def get_package_size(manager, name, path):
                 else:
                     md = importlib.import_module("importlib_metadata")
                 dist = md.distribution(name)
-                if dist and dist.files:
-                    package_path = dist.locate_file(dist.files[0]).parent
+                files = dist.files if dist else None
+                if files:
+                    package_path = dist.locate_file(files[0]).parent
                     return get_directory_size(str(package_path))
             except Exception:
                 pass
-        elif manager == "brew":
-            # For Homebrew, get formula size
-            out = run_cmd(["brew", "info", "--json=v2", name])
-            if out.strip():
-                try:
-                    data = json.loads(out)
-                    for coll in ("formulae", "casks"):
-                        for entry in data.get(coll, []) or []:
-                            if entry.get("name") == name:
-                                # Try to get installed size
-                                if entry.get("installed"):
-                                    for install in entry["installed"]:
-                                        if install.get("size"):
-                                            return install["size"]
-                except Exception:
-                    pass
         elif manager == "npm (global)":
             # For npm, get package directory size
-            npm_prefix = run_cmd(["npm", "config", "get", "prefix"]).strip()
+            npm_prefix = _get_npm_prefix()
             if npm_prefix:
                 package_path = os.path.join(npm_prefix, "lib", "node_modules", name)
                 if os.path.exists(package_path):
@@ -137,50 +341,129 @@ def get_package_size(manager, name, path):
         pass
     return 0
 
+def npm_global_package_dirs():
+    """Map global npm package names to their directories with one listing of node_modules."""
+    dirs = {}
+    npm_prefix = _get_npm_prefix()
+    if not npm_prefix:
+        return dirs
+    try:
+        with os.scandir(os.path.join(npm_prefix, "lib", "node_modules")) as it:
+            entries = list(it)
+    except OSError:
+        return dirs
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.name.startswith("@"):
+            # scoped packages live one level down: @scope/name
+            try:
+                with os.scandir(entry.path) as scoped:
+                    for sub in scoped:
+                        dirs[f"{entry.name}/{sub.name}"] = sub.path
+            except OSError:
+                pass
+        else:
+            dirs[entry.name] = entry.path
+    return dirs
+
+def fill_package_sizes(items):
+    """Compute size/size_formatted for gathered items whose size is still None.
+
+    Sizing is dominated by filesystem syscalls (which release the GIL), so
+    packages are sized on a small thread pool rather than one after another.
+    """
+    pending = [it for it in items if it.get("size") is None]
+    if pending:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sizes = pool.map(lambda it: get_package_size(it["manager"], it["name"], it["path"]), pending)
+            for it, size in zip(pending, sizes):
+                it["size"] = size
+    for it in items:
+        it["size_formatted"] = format_size(it["size"])
+    return items
+
+HISTORY_LIMIT = 100  # entries kept in the uninstall history
+HISTORY_COMPACT_BYTES = 256 * 1024  # rewrite the history file once it grows past this
+
+_history_lock = threading.Lock()
+
+def _history_payload(history):
+    return b"".join(_dumps(entry, indent=False) + b"\n" for entry in history)
+
 def load_uninstall_history():
-    """Load uninstall history from file."""
+    """Load the last HISTORY_LIMIT uninstall history entries from file."""
     try:
-        if HISTORY_PATH.exists():
-            return json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
+        return _load_json_cached(HISTORY_PATH, [], parse=_loads_lines)[-HISTORY_LIMIT:]
     except Exception:
         pass
     return []
 
 def save_uninstall_history(history):
-    """Save uninstall history to file."""
+    """Replace the uninstall history file with the given entries."""
+    try:
+        with _history_lock:
+            _write_bytes_atomic(HISTORY_PATH, _history_payload(history[-HISTORY_LIMIT:]))
+    except Exception:
+        pass
+
+def _compact_uninstall_history():
+    """Rewrite the history file with its last HISTORY_LIMIT entries; hold _history_lock."""
+    history = _load_json_cached(HISTORY_PATH, [], parse=_loads_lines)
+    _write_bytes_atomic(HISTORY_PATH, _history_payload(history[-HISTORY_LIMIT:]))
+
+def append_uninstall_history(entries):
+    """Append entries to the uninstall history without rewriting the file.
+
+    Old entries past HISTORY_LIMIT are only dropped when the file has grown
+    past HISTORY_COMPACT_BYTES, so a typical append is a single write.
+    """
+    if not entries:
+        return
+    try:
+        with _history_lock:
+            with open(HISTORY_PATH, "ab") as f:
+                f.write(_history_payload(entries))
+                size = f.tell()
+            with _json_cache_lock:
+                _json_cache.pop(HISTORY_PATH, None)
+            # Under the lock, so no append can land between the read and the rewrite
+            if size > HISTORY_COMPACT_BYTES:
+                _compact_uninstall_history()
+    except Exception:
+        pass
+
+def migrate_legacy_history():
+    """Convert a uninstall_history.json array from older versions to JSON Lines."""
     try:
-        HISTORY_PATH.write_text(json.dumps(history, indent=2), encoding="utf-8")
+        if not HISTORY_PATH.exists() and LEGACY_HISTORY_PATH.exists():
+            save_uninstall_history(_loads(LEGACY_HISTORY_PATH.read_bytes()))
+            LEGACY_HISTORY_PATH.unlink()
     except Exception:
         pass
 
 def add_to_uninstall_history(package_info):
     """Add package to uninstall history."""
-    history = load_uninstall_history()
-    history.append({
+    append_uninstall_history([{
         "name": package_info["name"],
         "version": package_info["version"],
         "manager": package_info["manager"],
         "uninstalled_at": datetime.now().isoformat(),
         "size": package_info.get("size", 0),
         "source": "dashboard_uninstall"
-    })
-    # Keep only last 100 entries
-    if len(history) > 100:
-        history = history[-100:]
-    save_uninstall_history(history)
+    }])
 
 def save_packages_snapshot(packages):
     """Save current packages as a snapshot for comparison."""
     try:
-        PREVIOUS_PACKAGES_PATH.write_text(json.dumps(packages, indent=2), encoding="utf-8")
+        _write_json_atomic(PREVIOUS_PACKAGES_PATH, packages)
     except Exception:
         pass
 
 def load_packages_snapshot():
     """Load previous packages snapshot."""
     try:
-        if PREVIOUS_PACKAGES_PATH.exists():
-            return json.loads(PREVIOUS_PACKAGES_PATH.read_text(encoding="utf-8"))
+        return _load_json_cached(PREVIOUS_PACKAGES_PATH, [])
     except Exception:
         pass
     return []
@@ -191,41 +474,39 @@ def detect_missing_packages(current_packages):
     if not previous_packages:
         return []
     
-    # Create sets for easy comparison
-    current_set = {(p.get("manager", ""), p.get("name", "")) for p in current_packages}
-    previous_set = {(p.get("manager", ""), p.get("name", "")) for p in previous_packages}
+    # Index previous packages by key (first occurrence wins) for easy comparison.
+    # Names are compared canonically: depending on how it was read, the same
+    # distribution can be listed as "PyYAML" or "pyyaml", "stack-data" or "stack_data".
+    current_set = {(p.get("manager", ""), canonical_name(p.get("name", ""))) for p in current_packages}
+    previous_by_key = {}
+    for p in previous_packages:
+        previous_by_key.setdefault((p.get("manager", ""), canonical_name(p.get("name", ""))), p)
     
     # Find packages that were in previous but not in current
-    missing_packages = previous_set - current_set
+    missing_packages = previous_by_key.keys() - current_set
     
     # Get full package info for missing packages
-    missing_info = []
-    for manager, name in missing_packages:
-        for pkg in previous_packages:
-            if pkg.get("manager") == manager and pkg.get("name") == name:
-                missing_info.append(pkg)
-                break
-    
-    return missing_info
+    return [previous_by_key[key] for key in missing_packages]
 
 def add_missing_packages_to_history(missing_packages):
     """Add detected missing packages to uninstall history."""
     if not missing_packages:
         return
     
-    history = load_uninstall_history()
+    already_recorded = {
+        (canonical_name(h.get("name") or ""), h.get("manager"))
+        for h in load_uninstall_history()
+        if h.get("source") == "detected_missing"
+    }
     
+    entries = []
     for package in missing_packages:
         # Check if this package is already in history
-        already_exists = any(
-            h.get("name") == package.get("name") and 
-            h.get("manager") == package.get("manager") and
-            h.get("source") == "detected_missing"
-            for h in history
-        )
+        key = (canonical_name(package.get("name") or ""), package.get("manager"))
         
-        if not already_exists:
-            history.append({
+        if key not in already_recorded:
+            already_recorded.add(key)
+            entries.append({
                 "name": package.get("name", ""),
                 "version": package.get("version", ""),
                 "manager": package.get("manager", ""),
@@ -234,23 +515,12 @@ def add_missing_packages_to_history(missing_packages):
                 "source": "detected_missing"
             })
     
-    # Keep only last 100 entries
-    if len(history) > 100:
-        history = history[-100:]
-    save_uninstall_history(history)
-
-def save_verification_status(verification_data):
-    """Save verification status to file."""
-    try:
-        VERIFICATION_STATUS_PATH.write_text(json.dumps(verification_data, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+    append_uninstall_history(entries)
 
 def load_verification_status():
     """Load verification status from file."""
     try:
-        if VERIFICATION_STATUS_PATH.exists():
-            return json.loads(VERIFICATION_STATUS_PATH.read_text(encoding="utf-8"))
+        return _load_json_cached(VERIFICATION_STATUS_PATH, {})
     except Exception:
         pass
     return {}
@@ -258,119 +528,276 @@ def load_verification_status():
 def save_verification_status(verification_data):
     """Save verification status to file."""
     try:
-        VERIFICATION_STATUS_PATH.write_text(json.dumps(verification_data, indent=2), encoding="utf-8")
+        _write_json_atomic(VERIFICATION_STATUS_PATH, verification_data)
     except Exception as e:
         print(f"Error saving verification status: {e}")
 
-def update_verification_status(manager, name, status_data):
-    """Update verification status for a specific package."""
-    verification_data = load_verification_status()
-    key = f"{manager}-{name}"
-    verification_data[key] = {
+_verification_lock = threading.Lock()
+
+def update_verification_status(manager, name, status_data, verification_data=None):
+    """Update verification status for a specific package.
+
+    With verification_data (from verification_session()) the entry is only
+    recorded in that dict; otherwise the file is loaded and saved right away.
+    """
+    entry = {
         "status": status_data.get("status", "unknown"),
         "message": status_data.get("message", ""),
         "verified_at": datetime.now().isoformat()
     }
-    save_verification_status(verification_data)
+    key = f"{manager}-{name}"
+    if verification_data is not None:
+        verification_data[key] = entry
+        return
+    with _verification_lock:
+        verification_data = load_verification_status()
+        verification_data[key] = entry
+        save_verification_status(verification_data)
+
+@contextlib.contextmanager
+def verification_session():
+    """Load verification status once, yield it, and save once on exit.
+
+    Only entries changed inside the block are merged back into the file, so
+    updates made meanwhile by other request threads are not lost; nothing is
+    written when nothing changed.
+    """
+    verification_data = load_verification_status()
+    before = dict(verification_data)
+    try:
+        yield verification_data
+    finally:
+        changed = {k: v for k, v in verification_data.items() if before.get(k) is not v}
+        if changed:
+            with _verification_lock:
+                current = load_verification_status()
+                current.update(changed)
+                save_verification_status(current)
+
+_audit_results = None  # {canonical name: [vulns]} from one pip-audit run
+_audit_lock = threading.Lock()
+
+def canonical_name(name):
+    """PEP 503 normalized project name, used to match pip-audit output."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def get_audit_results():
+    """Run pip-audit once for the whole environment and index vulnerabilities by package."""
+    global _audit_results
+    with _audit_lock:
+        if _audit_results is None:
+            results = {}
+            try:
+                # Not run_cmd(): pip-audit exits non-zero when it finds
+                # vulnerabilities and reports progress on stderr, both of which
+                # would throw the JSON report away.
+                proc = subprocess.run(
+                    [sys.executable, "-m", "pip_audit", "--format", "json"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=300
+                )
+                parsed = _loads(proc.stdout) if proc.stdout.strip() else {}
+                # pip-audit >= 2.5 wraps the list in {"dependencies": [...]}
+                deps = parsed.get("dependencies", []) if isinstance(parsed, dict) else parsed
+                for dep in deps or []:
+                    if isinstance(dep, dict) and dep.get("vulns"):
+                        results[canonical_name(norm(dep.get("name", "")))] = dep["vulns"]
+            except Exception:
+                # pip-audit not available or failed
+                pass
+            _audit_results = results
+        return _audit_results
 
-def verify_package_integrity(manager, name):
-    """Verify package integrity based on manager type."""
+def check_package_integrity(manager, name):
+    """Check package integrity based on manager type, without recording the result."""
     try:
         if manager == "pip (this Python)" or manager.startswith("pip"):
-            # For pip packages, check if package can be imported and show version
+            # For pip packages, check the installed distribution's metadata.
+            # Importing the package would run its top-level code (slow for
+            # heavy packages) and leave modules behind in sys.modules.
             try:
-                # Try to import the package
-                module = __import__(name)
-                version = getattr(module, '__version__', 'unknown')
+                if sys.version_info >= (3, 8):
+                    import importlib.metadata as md
+                else:
+                    md = importlib.import_module("importlib_metadata")
+                version = md.distribution(name).version or 'unknown'
                 
                 # Check if package has any known security issues via pip-audit if available
-                try:
-                    result = run_cmd([sys.executable, "-m", "pip_audit", "--format", "json", "--only", name])
-                    if result.strip():
-                        try:
-                            audit_data = json.loads(result)
-                            if audit_data.get("vulnerabilities"):
-                                vulns = len(audit_data["vulnerabilities"])
-                                result_data = {"status": "failed", "message": f"Package has {vulns} known vulnerabilities"}
-                                update_verification_status(manager, name, result_data)
-                                return result_data
-                        except json.JSONDecodeError:
-                            pass
-                except Exception:
-                    # pip-audit not available or failed, continue with basic check
-                    pass
+                vulns = len(get_audit_results().get(canonical_name(name), []))
+                if vulns:
+                    return {"status": "failed", "message": f"Package has {vulns} known vulnerabilities"}
                 
-                result_data = {"status": "verified", "message": f"Package verified (version: {version})"}
-                update_verification_status(manager, name, result_data)
-                return result_data
+                return {"status": "verified", "message": f"Package verified (version: {version})"}
             except ImportError:
-                result_data = {"status": "failed", "message": "Package cannot be imported"}
-                update_verification_status(manager, name, result_data)
-                return result_data
+                # md.PackageNotFoundError is an ImportError subclass
+                return {"status": "failed", "message": "Package metadata not found"}
             except Exception as e:
-                result_data = {"status": "failed", "message": f"Import error: {str(e)}"}
-                update_verification_status(manager, name, result_data)
-                return result_data
+                return {"status": "failed", "message": f"Metadata error: {str(e)}"}
         elif manager == "brew":
             # Use brew audit for integrity check
             result = run_cmd(["brew", "audit", "--strict", name])
             if "No problems" in result or result.strip() == "":
-                result_data = {"status": "verified", "message": "Package integrity verified"}
-                update_verification_status(manager, name, result_data)
-                return result_data
+                return {"status": "verified", "message": "Package integrity verified"}
             else:
-                result_data = {"status": "failed", "message": f"Audit issues: {result.strip()}"}
-                update_verification_status(manager, name, result_data)
-                return result_data
+                return {"status": "failed", "message": f"Audit issues: {result.strip()}"}
         elif manager == "npm (global)":
             # Check npm package integrity
-            npm_prefix = run_cmd(["npm", "config", "get", "prefix"]).strip()
+            npm_prefix = _get_npm_prefix()
             if npm_prefix:
                 package_path = os.path.join(npm_prefix, "lib", "node_modules", name)
                 if os.path.exists(package_path):
                     result = run_cmd(["npm", "audit", "--audit-level=moderate", "--prefix", package_path])
                     if "found 0 vulnerabilities" in result:
-                        result_data = {"status": "verified", "message": "Package integrity verified"}
-                        update_verification_status(manager, name, result_data)
-                        return result_data
+                        return {"status": "verified", "message": "Package integrity verified"}
                     else:
-                        result_data = {"status": "failed", "message": "Vulnerabilities found"}
-                        update_verification_status(manager, name, result_data)
-                        return result_data
-            result_data = {"status": "unknown", "message": "Could not verify npm package"}
-            update_verification_status(manager, name, result_data)
-            return result_data
+                        return {"status": "failed", "message": "Vulnerabilities found"}
+            return {"status": "unknown", "message": "Could not verify npm package"}
         else:
-            result_data = {"status": "unknown", "message": f"Unknown manager: {manager}"}
-            update_verification_status(manager, name, result_data)
-            return result_data
+            return {"status": "unknown", "message": f"Unknown manager: {manager}"}
     except Exception as e:
-        result_data = {"status": "error", "message": f"Error verifying {name}: {str(e)}"}
-        update_verification_status(manager, name, result_data)
-        return result_data
+        return {"status": "error", "message": f"Error verifying {name}: {str(e)}"}
+
+def verify_package_integrity(manager, name, verification_data=None):
+    """Verify package integrity and record the result in the verification status."""
+    result_data = check_package_integrity(manager, name)
+    update_verification_status(manager, name, result_data, verification_data)
+    return result_data
+
+VERIFY_CACHE_TTL = 300  # seconds a verification result is reused
+VERIFY_WAIT = 1.0  # seconds a request waits before answering "pending"
+VERIFY_SAVE_INTERVAL = 1.0  # while checks keep finishing, save at most this often
+
+_verify_results = {}  # (manager, name) -> (monotonic time, result)
+_verify_inflight = {}  # (manager, name) -> Future
+_verify_unsaved = {}  # (manager, name) -> result not yet in the status file
+_verify_saved_at = 0.0
+_verify_lock = threading.Lock()
+# Daemon workers: Ctrl-C must not wait for a running check (pip-audit can
+# take minutes)
+_verify_pool = DaemonThreadPool(8, "pkglens-verify")
+# "Verify All" batches queue here, so a single check never waits behind one
+_verify_batch_pool = DaemonThreadPool(8, "pkglens-verify-batch")
+
+def _save_verification_results():
+    """Record the results collected since the last save with one status file write."""
+    global _verify_saved_at
+    with _verify_lock:
+        unsaved = dict(_verify_unsaved)
+        _verify_unsaved.clear()
+        _verify_saved_at = time.monotonic()
+    if unsaved:
+        with verification_session() as verification_data:
+            for (manager, name), result in unsaved.items():
+                update_verification_status(manager, name, result, verification_data)
+
+def _verify_job(key):
+    try:
+        result = check_package_integrity(*key)
+    except Exception as e:
+        result = {"status": "error", "message": f"Error verifying {key[1]}: {str(e)}"}
+    with _verify_lock:
+        now = time.monotonic()
+        _verify_results[key] = (now, result)
+        _verify_inflight.pop(key, None)
+        _verify_unsaved[key] = result
+        # A batch finishing one check after another is saved once per interval
+        save = not _verify_inflight or now - _verify_saved_at >= VERIFY_SAVE_INTERVAL
+    if save:
+        _save_verification_results()
+    return result
+
+def _start_verification(key, pool):
+    """Return (cached result, None) or (None, future of the running check)."""
+    with _verify_lock:
+        hit = _verify_results.get(key)
+        if hit is not None and time.monotonic() - hit[0] < VERIFY_CACHE_TTL:
+            return hit[1], None
+        future = _verify_inflight.get(key)
+        if future is None:
+            future = _verify_inflight[key] = pool.submit(_verify_job, key)
+    return None, future
+
+def request_verification(manager, name, wait=VERIFY_WAIT):
+    """Return a cached or freshly computed verification result, or None if still running.
+
+    Checks run on a background pool, so a slow package manager never ties up
+    a server thread for longer than `wait`; callers ask again to collect it.
+    """
+    result, future = _start_verification((manager, name), _verify_pool)
+    if future is None:
+        return result
+    try:
+        return future.result(timeout=wait)
+    except FuturesTimeoutError:
+        return None
+
+def verify_packages(packages, wait=VERIFY_WAIT):
+    """Verify many (manager, name) pairs, like request_verification() for each.
+
+    All checks are queued at once and the call waits at most `wait` seconds
+    in total; pairs still being checked then come back as None.
+    """
+    started = [_start_verification(key, _verify_batch_pool) for key in packages]
+    deadline = time.monotonic() + wait
+    results = []
+    for result, future in started:
+        if future is not None:
+            try:
+                result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                result = None
+        results.append(result)
+    return results
+
+def forget_verification(manager, name):
+    """Drop a cached verification result, e.g. after the package was removed."""
+    with _verify_lock:
+        _verify_results.pop((manager, name), None)
+
+def load_conflicts_cache():
+    """Load the cached conflict scan ({"hash": ..., "conflicts": [...]})."""
+    try:
+        if CONFLICTS_CACHE_PATH.exists():
+            return _loads(CONFLICTS_CACHE_PATH.read_bytes())
+    except Exception:
+        pass
+    return {}
+
+def save_conflicts_cache(packages_hash, conflicts):
+    """Save a conflict scan together with the hash of the package list it covers."""
+    try:
+        _write_json_atomic(CONFLICTS_CACHE_PATH, {"hash": packages_hash, "conflicts": conflicts})
+    except Exception:
+        pass
 
-def detect_package_conflicts():
-    """Detect package conflicts and issues."""
+def detect_package_conflicts(force=False):
+    """Detect package conflicts and issues; force skips the cached scan."""
     conflicts = []
     
     try:
         # Load current package data
         if DATA_PATH.exists():
-            packages = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+            raw = DATA_PATH.read_bytes()
+            packages = _loads(raw)
         else:
             return conflicts
         
+        # The checks below (incl. the slow `pip check` / `brew doctor`) only
+        # depend on the scanned package list, so reuse the last result for it
+        packages_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cached = load_conflicts_cache()
+        if not force and cached.get("hash") == packages_hash:
+            return cached.get("conflicts", [])
+        
         # Group packages by manager
         pip_packages = [p for p in packages if p.get("manager", "").startswith("pip")]
         brew_packages = [p for p in packages if p.get("manager") == "brew"]
         npm_packages = [p for p in packages if p.get("manager") == "npm (global)"]
         
         # Check for duplicate packages across managers
-        all_names = [p.get("name", "").lower() for p in packages]
-        duplicates = {}
-        for name in all_names:
-            if all_names.count(name) > 1:
-                duplicates[name] = [p for p in packages if p.get("name", "").lower() == name]
+        by_name = defaultdict(list)
+        for p in packages:
+            by_name[canonical_name(p.get("name", ""))].append(p)
+        duplicates = {name: pkgs for name, pkgs in by_name.items() if len(pkgs) > 1}
         
         for name, pkgs in duplicates.items():
             if len(pkgs) > 1:
@@ -427,6 +854,7 @@ def detect_package_conflicts():
                 "suggestion": "Consider reviewing large packages for cleanup"
             })
         
+        save_conflicts_cache(packages_hash, conflicts)
     except Exception as e:
         conflicts.append({
             "type": "error",
@@ -468,9 +896,15 @@ def gather_pip_importlib():
         else:
             md = importlib.import_module("importlib_metadata")  # may not be installed
         for dist in md.distributions():
+            name = version = ""
+            # "<name>-<version>.dist-info": the installer already wrote both
+            # into the directory name, so there is no need to parse METADATA.
+            # Only .egg-info installs (no reliable naming) fall through below.
+            info_dir = getattr(dist, "_path", None)
+            if info_dir is not None and info_dir.suffix == ".dist-info":
+                name, _, version = info_dir.name[:-len(".dist-info")].partition("-")
             # dist.metadata can be an email.message.Message; use .get
-            meta = getattr(dist, "metadata", None)
-            name = ""
+            meta = getattr(dist, "metadata", None) if not name else None
             if meta is not None:
                 try:
                     name = meta.get("Name", "")  # Message.get
@@ -481,60 +915,83 @@ def gather_pip_importlib():
                     name = dist.metadata["Name"]  # type: ignore[index]
                 except Exception:
                     name = getattr(dist, "name", "")
-            version = getattr(dist, "version", "") or ""
+            if not version:
+                version = getattr(dist, "version", "") or ""
             path = ""
             try:
-                if hasattr(dist, "files") and dist.files and hasattr(dist, "locate_file"):
-                    path = str(dist.locate_file(dist.files[0]).parent)
+                # dist.files parses RECORD on every access; read it once
+                files = dist.files if hasattr(dist, "locate_file") else None
+                if files:
+                    path = str(dist.locate_file(files[0]).parent)
             except Exception:
                 path = ""
             
-            # Calculate package size
-            size = get_package_size("pip (this Python)", name, path)
-            
             items.append({
                 "manager": "pip (this Python)",
                 "name": norm(name),
                 "version": norm(version),
                 "path": norm(path),
                 "source": "importlib.metadata",
-                "size": size,
-                "size_formatted": format_size(size)
+                "size": None
             })
     except Exception:
         # ignore if importlib_metadata not available (py<3.8 without backport)
         pass
+    fill_package_sizes(items)
     print_progress(f"Found {len(items)} Python packages")
     return items
 
+def pip_cli_is_current_python(bin_name):
+    """True if the pip CLI found on PATH runs this interpreter's own pip.
+
+    Sharing a bin dir with sys.executable proves nothing (a Homebrew pip3 for
+    another Python, a python2 /usr/bin/pip), so ask the CLI: `pip -V` names
+    the directory pip was imported from and the Python version running it.
+    """
+    if not cmd_exists(bin_name):
+        return False
+    # "pip 23.2 from /.../site-packages/pip (python 3.11)"
+    version_line = run_cmd([bin_name, "-V"], timeout=30)
+    m = re.search(r" from (.+) \(python (\d+\.\d+)\)\s*$", version_line, re.M)
+    if not m or m.group(2) != "%d.%d" % sys.version_info[:2]:
+        return False
+    site_dir = os.path.realpath(os.path.dirname(m.group(1)))
+    return site_dir in {os.path.realpath(p) for p in sys.path if p}
+
+def gather_foreign_pip_cli(bin_name):
+    """gather_pip_cli(), unless that CLI belongs to this interpreter."""
+    if pip_cli_is_current_python(bin_name):
+        return []
+    return gather_pip_cli(bin_name)
+
 def gather_pip_cli(bin_name="pip"):
     """pip list --format=json via a given pip binary."""
     if not cmd_exists(bin_name):
         return []
     print_progress(f"Scanning {bin_name} packages...")
-    out = run_cmd([bin_name, "list", "--format=json"])
+    raw = run_cmd_bytes([bin_name, "list", "--format=json"])
     items = []
     parsed = None
     try:
-        parsed = json.loads(out) if out.strip().startswith("[") else None
+        parsed = _loads(raw) if raw.strip().startswith(b"[") else None
     except Exception:
         parsed = None
     if isinstance(parsed, list):
         for it in parsed:
             name = norm(it.get("name", ""))
-            size = get_package_size(bin_name, name, "")
             items.append({
                 "manager": bin_name,
                 "name": name,
                 "version": norm(it.get("version", "")),
                 "path": "",
                 "source": f"{bin_name} list --format=json",
-                "size": size,
-                "size_formatted": format_size(size)
+                "size": None
             })
+        fill_package_sizes(items)
         print_progress(f"Found {len(items)} {bin_name} packages")
         return items
     # fallback: try plain text (first column name, second version)
+    out = raw.decode("utf-8", errors="replace")
     for ln in out.splitlines():
         ln = ln.strip()
         if not ln or ln.lower().startswith("package"):
@@ -542,16 +999,15 @@ def gather_pip_cli(bin_name="pip"):
         parts = ln.split()
         if len(parts) >= 2:
             name = norm(parts[0])
-            size = get_package_size(bin_name, name, "")
             items.append({
                 "manager": bin_name,
                 "name": name,
                 "version": norm(parts[1]),
                 "path": "",
                 "source": f"{bin_name} list",
-                "size": size,
-                "size_formatted": format_size(size)
+                "size": None
             })
+    fill_package_sizes(items)
     print_progress(f"Found {len(items)} {bin_name} packages")
     return items
 
@@ -563,12 +1019,13 @@ def gather_brew():
     items = []
     
     # Get Homebrew prefix for path detection
-    brew_prefix = run_cmd(["brew", "--prefix"]).strip()
+    brew_prefix = _get_brew_prefix()
     
-    out = run_cmd(["brew", "info", "--json=v2", "--installed"])
+    # multi-MB for large installs: parse the bytes without decoding first
+    out = run_cmd_bytes(["brew", "info", "--json=v2", "--installed"])
     if out.strip():
         try:
-            data = json.loads(out)
+            data = _loads(out)
             # formulae + casks are both possible in v2
             for coll in ("formulae", "casks"):
                 for entry in data.get(coll, []) or []:
@@ -603,20 +1060,30 @@ def gather_brew():
                                 path = p
                                 break
                     
-                    size = get_package_size("brew", name, path)
+                    # Use the size from the bulk JSON when brew reports one;
+                    # otherwise fill_package_sizes() walks the install path.
+                    # Only formulae list their installs; a cask's "installed"
+                    # is just the version string.
+                    size = None
+                    installs = entry.get("installed")
+                    for install in installs if isinstance(installs, list) else []:
+                        if isinstance(install, dict) and install.get("size"):
+                            size = install["size"]
+                            break
                     items.append({
                         "manager": "brew",
                         "name": name,
                         "version": version,
                         "path": path,
                         "source": "brew info --json=v2 --installed",
-                        "size": size,
-                        "size_formatted": format_size(size)
+                        "size": size
                     })
+            fill_package_sizes(items)
             print_progress(f"Found {len(items)} Homebrew packages")
             return items
         except Exception:
-            pass
+            # start over: the fallback lists every package again
+            items = []
     
     # fallback: simple list
     out = run_cmd(["brew", "list", "--versions"])
@@ -642,16 +1109,15 @@ def gather_brew():
                     path = p
                     break
             
-            size = get_package_size("brew", name, path)
             items.append({
                 "manager": "brew",
                 "name": name,
                 "version": version,
                 "path": path,
                 "source": "brew list --versions",
-                "size": size,
-                "size_formatted": format_size(size)
+                "size": None
             })
+    fill_package_sizes(items)
     print_progress(f"Found {len(items)} Homebrew packages")
     return items
 
@@ -660,28 +1126,28 @@ def gather_npm():
     if not cmd_exists("npm"):
         return []
     print_progress("Scanning npm packages (global)...")
-    out = run_cmd(["npm", "-g", "ls", "--depth=0", "--json"])
+    raw = run_cmd_bytes(["npm", "-g", "ls", "--depth=0", "--json"])
+    package_dirs = npm_global_package_dirs()
     items = []
     try:
-        data = json.loads(out)
+        data = _loads(raw)
         deps = data.get("dependencies", {}) or {}
         for name, meta in deps.items():
             version = ""
             if isinstance(meta, dict):
                 version = norm(meta.get("version", ""))
             
-            size = get_package_size("npm (global)", name, "")
             items.append({
                 "manager": "npm (global)",
                 "name": norm(name),
                 "version": version,
-                "path": "",
+                "path": package_dirs.get(name, ""),
                 "source": "npm -g ls --depth=0 --json",
-                "size": size,
-                "size_formatted": format_size(size)
+                "size": None
             })
     except Exception:
         # fallback: npm -g ls --depth=0 (text)
+        out = raw.decode("utf-8", errors="replace")
         for ln in out.splitlines():
             ln = ln.strip()
             # lines often like: ├── typescript@5.4.5
@@ -689,18 +1155,17 @@ def gather_npm():
                 try:
                     part = ln.split("──", 1)[1].strip()
                     name, version = part.split("@", 1)
-                    size = get_package_size("npm (global)", name, "")
                     items.append({
                         "manager": "npm (global)",
                         "name": norm(name),
                         "version": norm(version),
-                        "path": "",
+                        "path": package_dirs.get(name, ""),
                         "source": "npm -g ls --depth=0",
-                        "size": size,
-                        "size_formatted": format_size(size)
+                        "size": None
                     })
                 except Exception:
                     pass
+    fill_package_sizes(items)
     print_progress(f"Found {len(items)} npm packages")
     return items
 
@@ -709,33 +1174,46 @@ def dedupe(items):
     seen = set()
     out = []
     for it in items:
-        m = norm(it.get("manager", ""))
-        n = norm(it.get("name", ""))
-        v = norm(it.get("version", ""))
+        # gatherers already produce strings almost everywhere
+        m = _fast_norm(it.get("manager", ""))
+        n = _fast_norm(it.get("name", ""))
+        v = _fast_norm(it.get("version", ""))
         key = (m, n, v)
         if key in seen:
             continue
         seen.add(key)
         # normalize stored values as well for a clean table
         it["manager"], it["name"], it["version"] = m, n, v
-        it["path"] = norm(it.get("path", ""))
-        it["source"] = norm(it.get("source", ""))
+        it["path"] = _fast_norm(it.get("path", ""))
+        it["source"] = _fast_norm(it.get("source", ""))
         out.append(it)
     return out
 
 def collect_all():
+    global _audit_results
     print_progress("Starting package scan...")
+    # sizes and audit results may have changed since the previous scan
+    _dir_size_cached.cache_clear()
+    _audit_results = None
     all_items = []
-    # Current Python env (importlib)
-    all_items += gather_pip_importlib()
-    # pip & pip3 CLIs (they might be same or different)
-    all_items += gather_pip_cli("pip")
-    if shutil.which("pip3") and shutil.which("pip3") != shutil.which("pip"):
-        all_items += gather_pip_cli("pip3")
-    # Homebrew
-    all_items += gather_brew()
-    # npm (global)
-    all_items += gather_npm()
+    # Every gatherer is dominated by subprocess/filesystem latency, so run them
+    # side by side. Results are merged in submission order so dedupe() keeps
+    # preferring the importlib entries, exactly as the serial version did.
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        # Current Python env (importlib)
+        futures = [pool.submit(gather_pip_importlib)]
+        # pip & pip3 CLIs (they might be same or different). A CLI installed
+        # in this interpreter's environment would just re-list the importlib
+        # results through a slow `pip list`, so only scan foreign ones.
+        futures.append(pool.submit(gather_foreign_pip_cli, "pip"))
+        if shutil.which("pip3") and shutil.which("pip3") != shutil.which("pip"):
+            futures.append(pool.submit(gather_foreign_pip_cli, "pip3"))
+        # Homebrew
+        futures.append(pool.submit(gather_brew))
+        # npm (global)
+        futures.append(pool.submit(gather_npm))
+        for fut in futures:
+            all_items += fut.result()
     
     print_progress("Deduplicating packages...")
     deduped = dedupe(all_items)
@@ -748,6 +1226,7 @@ HTML_TEMPLATE = """<!doctype html>
 <meta charset="utf-8">
 <title>Local Packages Dashboard</title>
 <meta name="viewport" content="width=device-width, initial-scale=1" />
+<link rel="preload" as="fetch" href="packages.json" crossorigin>
 <style>
   :root { --bg:#0b1220; --card:#11192a; --soft:#1a2336; --text:#e9eefb; --muted:#9db0cc; --accent:#8ab4ff; }
   html,body{margin:0;padding:0;background:var(--bg);color:var(--text);font-family:system-ui,-apple-system,Segoe UI,Roboto,Ubuntu,Cantarell,'Helvetica Neue',Arial,'Noto Sans',sans-serif;}
@@ -791,6 +1270,9 @@ HTML_TEMPLATE = """<!doctype html>
   .severity-badge.high{background:#dc2626;color:white}
   .severity-badge.medium{background:#f59e0b;color:white}
   .severity-badge.low{background:#10b981;color:white}
+  table.virtual td{white-space:nowrap;overflow:hidden;text-overflow:ellipsis;max-width:420px}
+  tr.vpad,tr.vpad:hover{background:none}
+  tr.vpad td{padding:0;border:0}
 </style>
 </head>
 <body>
@@ -817,8 +1299,8 @@ HTML_TEMPLATE = """<!doctype html>
             <span id="count" class="muted"></span>
           </div>
         </div>
-        <div style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
-          <table id="tbl">
+        <div class="table-scroll" style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
+          <table id="tbl" class="virtual">
             <thead>
               <tr>
                 <th data-k="manager">Manager</th>
@@ -832,6 +1314,7 @@ HTML_TEMPLATE = """<!doctype html>
             </thead>
             <tbody></tbody>
           </table>
+          <template id="pkgRowTpl"><tr><td><span class="pill"></span></td><td></td><td></td><td class="size-cell"></td><td class="muted"></td><td class="muted"></td><td><button class="uninstall-btn" data-action="uninstall">Uninstall</button> <button class="verify-btn" data-action="verify">Verify</button></td></tr></template>
         </div>
         <div class="footer">
           <div class="total-size" id="totalSize"></div>
@@ -857,8 +1340,8 @@ HTML_TEMPLATE = """<!doctype html>
             <span id="verificationCount" class="muted"></span>
           </div>
         </div>
-        <div style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
-          <table id="verificationTable">
+        <div class="table-scroll" style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
+          <table id="verificationTable" class="virtual">
             <thead>
               <tr>
                 <th data-k="manager">Manager</th>
@@ -872,6 +1355,7 @@ HTML_TEMPLATE = """<!doctype html>
             </thead>
             <tbody></tbody>
           </table>
+          <template id="verificationRowTpl"><tr><td><span class="pill"></span></td><td></td><td></td><td class="size-cell"></td><td><span class="verify-btn"></span></td><td class="muted"></td><td><button class="verify-btn" data-action="verify">Verify</button></td></tr></template>
         </div>
         <div class="footer">
           <div class="total-size" id="verificationTotalSize"></div>
@@ -908,8 +1392,8 @@ HTML_TEMPLATE = """<!doctype html>
             <span id="historyCount" class="muted"></span>
           </div>
         </div>
-        <div style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
-          <table id="historyTable">
+        <div class="table-scroll" style="overflow:auto; max-height:70vh; border-radius:12px; border:1px solid #1b294a;">
+          <table id="historyTable" class="virtual">
             <thead>
               <tr>
                 <th>Package</th>
@@ -922,29 +1406,162 @@ HTML_TEMPLATE = """<!doctype html>
             </thead>
             <tbody></tbody>
           </table>
+          <template id="historyRowTpl"><tr><td></td><td></td><td><span class="pill"></span></td><td class="size-cell"></td><td><span class="pill"></span></td><td class="muted"></td></tr></template>
         </div>
       </div>
     </div>
   </div>
 <script>
+// Element references, looked up once; none of these nodes is ever replaced
+const $ = id => document.getElementById(id);
+const els = Object.freeze({
+  clearHistory: $('clearHistory'),
+  conflictsCount: $('conflictsCount'),
+  conflictsList: $('conflictsList'),
+  count: $('count'),
+  detectMissingBtn: $('detectMissingBtn'),
+  exportCsv: $('exportCsv'),
+  historyCount: $('historyCount'),
+  historyRowTpl: $('historyRowTpl'),
+  historySearch: $('historySearch'),
+  historySourceFilter: $('historySourceFilter'),
+  mgr: $('mgr'),
+  pkgRowTpl: $('pkgRowTpl'),
+  q: $('q'),
+  refreshBtn: $('refreshBtn'),
+  refreshConflicts: $('refreshConflicts'),
+  refreshVerification: $('refreshVerification'),
+  scanConflicts: $('scanConflicts'),
+  totalSize: $('totalSize'),
+  verificationCount: $('verificationCount'),
+  verificationFilter: $('verificationFilter'),
+  verificationRowTpl: $('verificationRowTpl'),
+  verificationSearch: $('verificationSearch'),
+  verificationTotalSize: $('verificationTotalSize'),
+  verifyAllBtn: $('verifyAllBtn'),
+  pkgTbody: document.querySelector('#tbl tbody'),
+  verificationTbody: document.querySelector('#verificationTable tbody'),
+  historyTbody: document.querySelector('#historyTable tbody')
+});
+
 let data = [];
+let dataByManager = new Map(); // manager -> rows of data, in data's order
 let history = [];
 let verificationStatus = {}; // Track verification status for each package
-
-async function loadVerificationStatus() {
+// Bumped whenever the corresponding data changes; part of the filter cache keys
+let dataVersion = 0, historyVersion = 0, verificationStatusVersion = 0;
+// Only the visible tab is rendered; tabs whose data changed while hidden are
+// kept here and rendered when next opened (see renderIfVisible)
+let activeTab = 'packages';
+const staleTabs = new Set();
+
+// Results verified in this browser are kept in localStorage for an hour, so
+// a reload shows them immediately and Verify All doesn't redo them.
+const VERIFICATION_CACHE_KEY = 'pkglens.verification';
+const VERIFICATION_CACHE_TTL_MS = 60 * 60 * 1000;
+const verificationCachedAt = {}; // key -> ms timestamp of locally verified entries
+
+function readVerificationCache() {
   try {
-    const response = await fetch('/api/verification-status');
-    const result = await response.json();
-    if (result.success) {
-      verificationStatus = result.verification_status || {};
-    } else {
-      verificationStatus = {};
+    const cached = JSON.parse(localStorage.getItem(VERIFICATION_CACHE_KEY) || '{}');
+    const cutoff = Date.now() - VERIFICATION_CACHE_TTL_MS;
+    for (const [key, entry] of Object.entries(cached)) {
+      if (entry.t > cutoff) {
+        verificationStatus[key] = entry.s;
+        verificationCachedAt[key] = entry.t;
+      }
     }
   } catch (e) {
-    verificationStatus = {};
+    // Missing or corrupt cache: start empty
   }
 }
 
+function writeVerificationCache() {
+  const cutoff = Date.now() - VERIFICATION_CACHE_TTL_MS;
+  const cached = {};
+  for (const [key, t] of Object.entries(verificationCachedAt)) {
+    if (t > cutoff && verificationStatus[key]) cached[key] = {t, s: verificationStatus[key]};
+  }
+  try {
+    localStorage.setItem(VERIFICATION_CACHE_KEY, JSON.stringify(cached));
+  } catch (e) {
+    // Storage full or disabled; the cache is only an optimization
+  }
+}
+
+// Bursts of updates (e.g. a Verify All batch) coalesce into one write
+const persistVerificationCache = debounce(writeVerificationCache, 500);
+window.addEventListener('pagehide', () => {
+  persistVerificationCache.cancel();
+  writeVerificationCache();
+});
+
+function setVerificationStatus(manager, name, status) {
+  const key = `${manager}-${name}`;
+  verificationStatus[key] = status;
+  verificationCachedAt[key] = Date.now();
+  verificationStatusVersion++;
+  persistVerificationCache();
+  updateVerificationRow(manager, name);
+  // A filtered verification view may need different rows next time it's shown
+  if (activeTab !== 'verification' && verificationFilterActive()) staleTabs.add('verification');
+}
+
+readVerificationCache();
+
+// Filtered rows are reused until their key (data version + filter inputs) changes,
+// so re-renders from scrolling, tab switches, etc. don't re-run the filter.
+function memoFilter(cache, key, compute) {
+  if (cache.key !== key) {
+    cache.key = key;
+    cache.rows = compute();
+    cache.totalSize = calculateTotalSize(cache.rows);
+  }
+  return cache;
+}
+const _pkgCache = {key: null, rows: null};
+const _verificationCache = {key: null, rows: null};
+const _historyCache = {key: null, rows: null};
+
+// A failed load keeps whatever was hydrated from the local cache
+function applyVerificationStatus(result) {
+  if (result.success) {
+    // Entries verified locally within the cache TTL take precedence
+    const local = {};
+    for (const key of Object.keys(verificationCachedAt)) local[key] = verificationStatus[key];
+    verificationStatus = {...(result.verification_status || {}), ...local};
+  }
+  verificationStatusVersion++;
+  staleTabs.add('verification');
+}
+
+// Lowercased search text is built once per load, so filtering is a single
+// includes() per row instead of several toLowerCase() calls per keystroke.
+function indexRows(rows, fields) {
+  for (const r of rows) {
+    r._searchBlob = fields.map(f => r[f] || "").join("\\0").toLowerCase();
+  }
+}
+
+// Per-column sort keys: lowercased strings, except size which stays numeric
+const SORT_KEYS = ["manager", "name", "version", "path", "source"];
+function indexSortKeys(rows) {
+  for (const r of rows) {
+    const lc = {size: r.size || 0};
+    for (const k of SORT_KEYS) lc[k] = (r[k] || "").toLowerCase();
+    r._lc = lc;
+  }
+}
+
+function groupByManager(rows) {
+  const groups = new Map();
+  for (const r of rows) {
+    const group = groups.get(r.manager);
+    if (group) group.push(r); else groups.set(r.manager, [r]);
+  }
+  return groups;
+}
+
 async function loadData() {
   try {
     const res = await fetch('packages.json');
@@ -953,16 +1570,46 @@ async function loadData() {
     console.error('Failed to load packages:', e);
     data = [];
   }
+  indexRows(data, ["name", "version", "source", "path", "manager"]);
+  // The verification search only looks at name/manager (plus the live status message)
+  for (const r of data) {
+    r._nameBlob = ((r.name || "") + "\\0" + (r.manager || "")).toLowerCase();
+    r._vkey = `${r.manager}-${r.name}`; // verificationStatus key
+  }
+  indexSortKeys(data);
+  dataByManager = groupByManager(data);
+  dataVersion++;
+  staleTabs.add('packages').add('verification');
+  syncPackageWorker();
 }
 
+const HISTORY_LIMIT = 100; // matches the server's HISTORY_LIMIT
+
 async function loadHistory() {
+  const entries = [];
   try {
-    const res = await fetch('uninstall_history.json');
-    history = await res.json();
+    // JSON Lines: one entry per line, oldest first
+    const res = await fetch('uninstall_history.jsonl');
+    for (const line of (await res.text()).split("\\n")) {
+      if (!line.trim()) continue;
+      try {
+        const entry = JSON.parse(line);
+        if (entry && typeof entry === 'object') entries.push(entry);
+      } catch (e) {
+        // Skip a torn or corrupt line rather than losing the whole history
+      }
+    }
   } catch (e) {
     console.error('Failed to load history:', e);
-    history = [];
   }
+  applyHistory(entries);
+}
+
+function applyHistory(entries) {
+  history = entries.slice(-HISTORY_LIMIT);
+  indexRows(history, ["name", "manager", "source"]);
+  historyVersion++;
+  staleTabs.add('history');
 }
 
 function formatDate(dateStr) {
@@ -972,38 +1619,150 @@ function formatDate(dateStr) {
 
 function esc(s){return (s+"").replace(/[&<>"]/g, c => ({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[c]));}
 
+function debounce(fn, ms) {
+  let timer = null;
+  const debounced = (...args) => {
+    clearTimeout(timer);
+    timer = setTimeout(() => { timer = null; fn(...args); }, ms);
+  };
+  debounced.cancel = () => { clearTimeout(timer); timer = null; };
+  return debounced;
+}
+
 function calculateTotalSize(items) {
   return items.reduce((total, item) => total + (item.size || 0), 0);
 }
 
+const SIZE_UNITS = ["B", "KB", "MB", "GB", "TB"];
+const _sizeLabels = new Map(); // sizes repeat a lot (0, 4096, ...)
+
 function formatSize(size) {
-  if (size === 0) return "0 B";
-  const units = ["B", "KB", "MB", "GB", "TB"];
-  let i = 0;
-  while (size >= 1024 && i < units.length - 1) {
-    size /= 1024.0;
-    i++;
+  if (!size) return "0 B";
+  let label = _sizeLabels.get(size);
+  if (label === undefined) {
+    const i = Math.max(0, Math.min(SIZE_UNITS.length - 1, Math.floor(Math.log2(size) / 10)));
+    label = (size / Math.pow(1024, i)).toFixed(1) + " " + SIZE_UNITS[i];
+    if (_sizeLabels.size >= 4096) _sizeLabels.clear();
+    _sizeLabels.set(size, label);
   }
-  return size.toFixed(1) + " " + units[i];
+  return label;
 }
 
-async function verifyPackage(manager, name) {
-  const btn = document.getElementById(`verify-${manager}-${name}`);
-  if (!btn) return;
+// Windowed ("virtual") table rendering: only rows that intersect the scroll
+// viewport, plus one viewport of overscan on either side, are in the DOM.
+// Spacer rows above and below keep the scrollbar sized for the full list.
+function createVirtualTable(tbody, renderRow, {keyOf, updateRow} = {}) {
+  const scroller = tbody.closest('.table-scroll');
+  const cols = tbody.closest('table').querySelectorAll('thead th').length;
+  function spacer() {
+    const tr = document.createElement('tr');
+    tr.className = 'vpad';
+    const td = document.createElement('td');
+    td.colSpan = cols;
+    tr.appendChild(td);
+    return tr;
+  }
+  const top = spacer(), bottom = spacer();
+  // With keyOf, vt.rendered maps each currently rendered row's key to its <tr>;
+  // with updateRow too, those <tr>s are refreshed and reused by the next render
+  // instead of being rebuilt (appending them to the fragment just moves them).
+  const vt = {rows: [], rowHeight: 0, start: -1, end: -1, rendered: new Map()};
   
-  btn.textContent = 'Verifying...';
-  btn.disabled = true;
+  vt.render = function(force) {
+    const n = vt.rows.length;
+    const rowHeight = vt.rowHeight || 45;
+    const viewport = scroller.clientHeight || window.innerHeight * 0.7;
+    const visible = Math.ceil(viewport / rowHeight);
+    const first = Math.min(Math.floor(scroller.scrollTop / rowHeight), Math.max(0, n - visible));
+    const start = Math.max(0, first - visible);
+    const end = Math.min(n, first + 2 * visible);
+    if (!force && start === vt.start && end === vt.end) return;
+    vt.start = start;
+    vt.end = end;
+    top.firstChild.style.height = (start * rowHeight) + 'px';
+    bottom.firstChild.style.height = ((n - end) * rowHeight) + 'px';
+    // Build off-DOM and swap in with a single mutation
+    const frag = document.createDocumentFragment();
+    frag.appendChild(top);
+    const previous = vt.rendered;
+    vt.rendered = new Map();
+    for (let i = start; i < end; i++) {
+      const row = vt.rows[i];
+      let tr;
+      if (keyOf) {
+        const key = keyOf(row);
+        tr = updateRow && previous.get(key);
+        // A <tr> can only be reused once, even if two rows were to share a key
+        if (tr) { previous.delete(key); updateRow(tr, row); } else tr = renderRow(row);
+        vt.rendered.set(key, tr);
+      } else {
+        tr = renderRow(row);
+      }
+      frag.appendChild(tr);
+    }
+    frag.appendChild(bottom);
+    tbody.replaceChildren(frag);
+    // Measure a real row once one is laid out (impossible while its tab is hidden)
+    if (!vt.rowHeight && end > start) {
+      const h = top.nextElementSibling.getBoundingClientRect().height;
+      if (h) {
+        vt.rowHeight = h;
+        vt.render(true);
+      }
+    }
+  };
   
-  try {
+  // Renders requested within one frame (several setRows calls, scroll events)
+  // collapse into a single render on the next animation frame.
+  let scheduled = false, forced = false;
+  vt.scheduleRender = function(force) {
+    forced = forced || !!force;
+    if (scheduled) return;
+    scheduled = true;
+    requestAnimationFrame(() => {
+      const f = forced;
+      scheduled = forced = false;
+      vt.render(f);
+    });
+  };
+  
+  vt.setRows = function(rows) {
+    vt.rows = rows;
+    vt.scheduleRender(true);
+  };
+  
+  scroller.addEventListener('scroll', () => vt.scheduleRender(false));
+  return vt;
+}
+
+const VERIFY_POLL_MS = 1000;
+
+// POST /api/verify, asking again while the server reports the check as pending
+async function requestVerification(manager, name) {
+  for (;;) {
     const response = await fetch('/api/verify', {
       method: 'POST',
       headers: {'Content-Type': 'application/json'},
       body: JSON.stringify({manager, name})
     });
-    
     const result = await response.json();
+    if (!result.pending) return result;
+    await new Promise(resolve => setTimeout(resolve, VERIFY_POLL_MS));
+  }
+}
+
+async function verifyPackage(manager, name, btn) {
+  if (!btn) return;
+  
+  btn.textContent = 'Verifying...';
+  btn.disabled = true;
+  
+  try {
+    const result = await requestVerification(manager, name);
     
     if (result.success) {
+      // Store verification result for the verification tab
+      setVerificationStatus(manager, name, result.result);
       const status = result.result.status;
       btn.textContent = status === 'verified' ? '✅ Verified' : 
                        status === 'failed' ? '❌ Failed' : '❓ Unknown';
@@ -1024,63 +1783,67 @@ async function verifyPackage(manager, name) {
   } finally {
     btn.disabled = false;
   }
-  
-  // Store verification result for the verification tab
-  if (result.success) {
-    verificationStatus[`${manager}-${name}`] = result.result;
-  }
 }
 
 async function verifyPackageForTab(manager, name) {
   try {
-    const response = await fetch('/api/verify', {
-      method: 'POST',
-      headers: {'Content-Type': 'application/json'},
-      body: JSON.stringify({manager, name})
-    });
-    
-    const result = await response.json();
+    const result = await requestVerification(manager, name);
     
     if (result.success) {
-      verificationStatus[`${manager}-${name}`] = result.result;
+      setVerificationStatus(manager, name, result.result);
       return result.result;
     } else {
-      verificationStatus[`${manager}-${name}`] = {status: 'error', message: result.message};
+      setVerificationStatus(manager, name, {status: 'error', message: result.message});
       return {status: 'error', message: result.message};
     }
   } catch (e) {
-    verificationStatus[`${manager}-${name}`] = {status: 'error', message: e.message};
+    setVerificationStatus(manager, name, {status: 'error', message: e.message});
     return {status: 'error', message: e.message};
   }
 }
 
 async function verifyAllPackages() {
-  const btn = document.getElementById('verifyAllBtn');
+  const btn = els.verifyAllBtn;
   if (!btn) return;
   
   btn.textContent = 'Verifying...';
   btn.disabled = true;
   
   try {
-    // Verify packages in batches to avoid overwhelming the server
-    const packages = data.filter(pkg => !verificationStatus[`${pkg.manager}-${pkg.name}`]);
-    const batchSize = 5;
+    // One request for every unverified package; the server verifies them in
+    // parallel and answers within a second, so ask again for the pending ones
+    // Status is per manager/name, so versions of one package are checked once
+    const unverified = new Map();
+    for (const pkg of data) {
+      const key = `${pkg.manager}-${pkg.name}`;
+      if (!verificationStatus[key] && !unverified.has(key)) {
+        unverified.set(key, {manager: pkg.manager, name: pkg.name});
+      }
+    }
+    let packages = [...unverified.values()];
+    const total = packages.length;
     
-    for (let i = 0; i < packages.length; i += batchSize) {
-      const batch = packages.slice(i, i + batchSize);
-      const promises = batch.map(pkg => verifyPackageForTab(pkg.manager, pkg.name));
-      await Promise.all(promises);
-      
-      // Update progress
-      const progress = Math.min(100, ((i + batchSize) / packages.length) * 100);
-      btn.textContent = `Verifying... ${Math.round(progress)}%`;
-      
-      // Small delay between batches
-      await new Promise(resolve => setTimeout(resolve, 100));
+    while (packages.length) {
+      const response = await fetch('/api/verify-batch', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({packages})
+      });
+      const result = await response.json();
+      if (!result.success) throw new Error(result.message);
+      packages = [];
+      for (const r of result.results) {
+        if (r.pending) packages.push({manager: r.manager, name: r.name});
+        else setVerificationStatus(r.manager, r.name, r.result);
+      }
+      if (packages.length) {
+        btn.textContent = `Verifying... ${Math.round((total - packages.length) / total * 100)}%`;
+        await new Promise(resolve => setTimeout(resolve, VERIFY_POLL_MS));
+      }
     }
     
     btn.textContent = '🔍 Verify All';
-    renderVerification();
+    if (verificationFilterActive()) renderVerification();
   } catch (e) {
     btn.textContent = '🔍 Verify All';
     alert(`Error verifying packages: ${e.message}`);
@@ -1089,17 +1852,16 @@ async function verifyAllPackages() {
   }
 }
 
+const UNVERIFIED = Object.freeze({status: 'unverified', message: 'Not verified yet'});
+
+// Returns the stored status object itself (treat as read-only)
 function getVerificationStatus(manager, name) {
-  const key = `${manager}-${name}`;
-  const status = verificationStatus[key];
-  if (status) {
-    return {
-      status: status.status,
-      message: status.message,
-      verified_at: status.verified_at
-    };
-  }
-  return {status: 'unverified', message: 'Not verified yet'};
+  return verificationStatus[`${manager}-${name}`] || UNVERIFIED;
+}
+
+// Same lookup for a loaded package row, via the key precomputed in loadData
+function itemVerificationStatus(item) {
+  return verificationStatus[item._vkey] || UNVERIFIED;
 }
 
 function getStatusIcon(status) {
@@ -1123,61 +1885,97 @@ function getStatusClass(status) {
 }
 
 function renderVerification() {
-  const searchInput = document.getElementById('verificationSearch');
-  const filterSelect = document.getElementById('verificationFilter');
-  const tbody = document.querySelector('#verificationTable tbody');
-  const count = document.getElementById('verificationCount');
-  const totalSizeEl = document.getElementById('verificationTotalSize');
+  const searchInput = els.verificationSearch;
+  const filterSelect = els.verificationFilter;
+  const count = els.verificationCount;
+  const totalSizeEl = els.verificationTotalSize;
   
   const searchTerm = searchInput.value.trim().toLowerCase();
   const filterStatus = filterSelect.value;
   
-  const filtered = data.filter(item => {
-    const status = getVerificationStatus(item.manager, item.name);
+  const key = `${dataVersion}|${verificationStatusVersion}|${searchTerm}|${filterStatus}`;
+  const {rows: filtered, totalSize} = memoFilter(_verificationCache, key, () => data.filter(item => {
+    const status = itemVerificationStatus(item);
+    
+    // Apply status filter
+    if (filterStatus && status.status !== filterStatus) return false;
     
     // Apply search filter
     if (searchTerm) {
-      const matches = item.name.toLowerCase().includes(searchTerm) ||
-                     item.manager.toLowerCase().includes(searchTerm) ||
-                     status.message.toLowerCase().includes(searchTerm);
-      if (!matches) return false;
+      return item._nameBlob.includes(searchTerm) ||
+             (status.message || "").toLowerCase().includes(searchTerm);
     }
     
-    // Apply status filter
-    if (filterStatus && status.status !== filterStatus) return false;
-    
     return true;
-  });
+  }));
   
-  tbody.innerHTML = "";
-  for (const item of filtered) {
-    const status = getVerificationStatus(item.manager, item.name);
-    const tr = document.createElement('tr');
-    tr.innerHTML = `
-      <td><span class="pill">${esc(item.manager)}</span></td>
-      <td>${esc(item.name)}</td>
-      <td>${esc(item.version)}</td>
-      <td class="size-cell">${esc(item.size_formatted || "0 B")}</td>
-      <td>
-        <span class="verify-btn ${getStatusClass(status.status)}">
-          ${getStatusIcon(status.status)} ${status.status}
-        </span>
-      </td>
-      <td class="muted">${esc(status.message)}</td>
-      <td>
-        <button class="verify-btn" onclick="verifyPackageForTab('${esc(item.manager)}', '${esc(item.name)}').then(() => renderVerification())">
-          Verify
-        </button>
-      </td>
-    `;
-    tbody.appendChild(tr);
-  }
+  verificationTable.setRows(filtered);
   
   count.textContent = `${filtered.length} / ${data.length} packages`;
-  const totalSize = calculateTotalSize(filtered);
   totalSizeEl.textContent = `Total size: ${formatSize(totalSize)}`;
 }
 
+// Rows are cloned from the <template>s next to each table and filled via
+// textContent, so rendering never goes through the HTML parser or esc().
+function cloneRow(tpl) {
+  return tpl.content.firstElementChild.cloneNode(true);
+}
+
+function fillVerificationStatus(tr, status) {
+  const c = tr.children;
+  const badge = c[4].firstChild;
+  badge.className = `verify-btn ${getStatusClass(status.status)}`;
+  badge.textContent = `${getStatusIcon(status.status)} ${status.status}`;
+  c[5].textContent = c[5].title = status.message || "";
+}
+
+// Refresh a verification <tr>; the package cells are only rewritten when the
+// row is reused for a different (e.g. reloaded) package object.
+function updateVerificationRowEl(tr, item) {
+  if (tr._item !== item) {
+    const c = tr.children;
+    c[0].firstChild.textContent = item.manager || "";
+    c[1].textContent = item.name || "";
+    c[2].textContent = item.version || "";
+    c[3].textContent = item.size_formatted || "0 B";
+    tr.dataset.manager = item.manager;
+    tr.dataset.name = item.name;
+    tr._item = item;
+  }
+  fillVerificationStatus(tr, itemVerificationStatus(item));
+}
+
+function renderVerificationRow(item) {
+  const tr = cloneRow(els.verificationRowTpl);
+  updateVerificationRowEl(tr, item);
+  return tr;
+}
+
+// dedupe() keeps one row per manager/name/version; e.g. a user-site and a
+// system-site copy of a package only differ in version
+const verificationTable = createVirtualTable(els.verificationTbody, renderVerificationRow, {
+  keyOf: item => item.manager + "\\0" + item.name + "\\0" + item.version,
+  updateRow: updateVerificationRowEl,
+});
+
+// Patch the rendered rows' status cells in place as results arrive; the
+// status is shared by every version of manager/name
+function updateVerificationRow(manager, name) {
+  let status = null;
+  for (const tr of verificationTable.rendered.values()) {
+    if (tr._item.manager !== manager || tr._item.name !== name) continue;
+    status = status || getVerificationStatus(manager, name);
+    fillVerificationStatus(tr, status);
+  }
+}
+
+// Only a status filter or search (which also matches messages) can change
+// which rows are shown; otherwise the in-place row updates are enough.
+function verificationFilterActive() {
+  return !!(els.verificationFilter.value ||
+            els.verificationSearch.value.trim());
+}
+
 async function uninstallPackage(manager, name) {
   if (!confirm(`Are you sure you want to uninstall ${name}?`)) {
     return;
@@ -1196,7 +1994,7 @@ async function uninstallPackage(manager, name) {
       alert(`Successfully uninstalled ${name}`);
       // Refresh data
       await loadData();
-      renderPackages();
+      renderIfVisible('packages');
     } else {
       alert(`Failed to uninstall ${name}: ${result.message}`);
     }
@@ -1206,7 +2004,7 @@ async function uninstallPackage(manager, name) {
 }
 
 function populateManagerDropdown() {
-  const mgrSel = document.getElementById('mgr');
+  const mgrSel = els.mgr;
   const currentValue = mgrSel.value; // Preserve current selection
   
   mgrSel.innerHTML = '<option value="">All managers</option>';
@@ -1223,104 +2021,250 @@ function populateManagerDropdown() {
   }
 }
 
+// Packages matching the search box and manager filter; shared by the table
+// and the CSV export, and memoized until the data or the filter changes.
+function filteredPackages() {
+  const state = {
+    q: els.q.value.trim(),
+    mgr: els.mgr.value
+  };
+  const needle = state.q.toLowerCase();
+  const key = `${dataVersion}|${state.q}|${state.mgr}`;
+  return memoFilter(_pkgCache, key, () => {
+    // A selected manager only needs its own bucket scanned
+    const src = state.mgr ? (dataByManager.get(state.mgr) || []) : data;
+    return needle ? src.filter(row => row._searchBlob.includes(needle)) : src.slice();
+  });
+}
+
+// Very large package lists are filtered, sorted and exported in a Web Worker
+// so typing stays responsive. The worker keeps a copy of the rows in the same
+// order as `data` and answers with row indices; below the threshold, or where
+// workers are unavailable, everything runs on the main thread as before.
+const WORKER_MIN_ROWS = 20000;
+const CSV_COLS = ["manager","name","version","size_formatted","path","source"];
+
+function packageWorkerMain() {
+  let rows = [], byManager = new Map(); // manager -> row indices
+  function group() {
+    byManager = new Map();
+    rows.forEach((r, i) => {
+      const g = byManager.get(r.manager);
+      if (g) g.push(i); else byManager.set(r.manager, [i]);
+    });
+  }
+  function select(q, mgr) {
+    const needle = q.toLowerCase();
+    const src = mgr ? (byManager.get(mgr) || []) : rows.map((_, i) => i);
+    return needle ? src.filter(i => rows[i].blob.includes(needle)) : src;
+  }
+  self.onmessage = e => {
+    const m = e.data;
+    if (m.type === 'load') {
+      rows = m.rows;
+      group();
+    } else if (m.type === 'filter') {
+      const indices = Int32Array.from(select(m.q, m.mgr));
+      let totalSize = 0;
+      for (const i of indices) totalSize += rows[i].size || 0;
+      self.postMessage({id: m.id, indices, totalSize}, [indices.buffer]);
+    } else if (m.type === 'sort') {
+      const order = rows.map((_, i) => i);
+      order.sort((a, b) => {
+        const ka = rows[a].lc[m.key], kb = rows[b].lc[m.key];
+        return ka < kb ? -m.dir : ka > kb ? m.dir : 0;
+      });
+      rows = order.map(i => rows[i]);
+      group();
+      const perm = Int32Array.from(order);
+      self.postMessage({id: m.id, order: perm}, [perm.buffer]);
+    } else if (m.type === 'csv') {
+      const parts = [m.cols.join(",") + "\\n"];
+      for (const i of select(m.q, m.mgr)) {
+        const r = rows[i].csv;
+        parts.push(m.cols.map(c => `"${String(r[c]||"").replace(/"/g,'""')}"`).join(",") + "\\n");
+      }
+      self.postMessage({id: m.id, blob: new Blob(parts, {type: "text/csv"})});
+    }
+  };
+}
+
+let packageWorker = null, workerSeq = 0;
+const workerPending = new Map();
+
+function stopPackageWorker() {
+  if (packageWorker) packageWorker.terminate();
+  packageWorker = null;
+  // Callers treat a null reply as "do it on the main thread"
+  for (const resolve of workerPending.values()) resolve(null);
+  workerPending.clear();
+}
+
+function workerRequest(msg) {
+  if (!packageWorker) return Promise.resolve(null);
+  return new Promise(resolve => {
+    const id = ++workerSeq;
+    workerPending.set(id, resolve);
+    packageWorker.postMessage({...msg, id});
+  });
+}
+
+// Called after every load: start, feed or stop the worker depending on size
+function syncPackageWorker() {
+  if (data.length < WORKER_MIN_ROWS || typeof Worker === 'undefined') {
+    stopPackageWorker();
+    return;
+  }
+  if (!packageWorker) {
+    try {
+      const src = `(${packageWorkerMain})()`;
+      packageWorker = new Worker(URL.createObjectURL(new Blob([src], {type: 'application/javascript'})));
+    } catch (e) {
+      packageWorker = null; // e.g. a CSP that forbids blob: workers
+      return;
+    }
+    packageWorker.onmessage = e => {
+      const resolve = workerPending.get(e.data.id);
+      workerPending.delete(e.data.id);
+      if (resolve) resolve(e.data);
+    };
+    packageWorker.onerror = () => stopPackageWorker();
+  }
+  packageWorker.postMessage({type: 'load', rows: data.map(r => {
+    const csv = {};
+    for (const c of CSV_COLS) csv[c] = r[c];
+    return {blob: r._searchBlob, manager: r.manager, size: r.size, lc: r._lc, csv};
+  })});
+}
+
+function showPackages({rows: filtered, totalSize}) {
+  pkgTable.setRows(filtered);
+  els.count.textContent = `${filtered.length} / ${data.length} packages`;
+  els.totalSize.textContent = `Total size: ${formatSize(totalSize)}`;
+}
+
 function renderPackages() {
-  const mgrSel = document.getElementById('mgr');
-  const q = document.getElementById('q');
-  const tbody = document.querySelector('#tbl tbody');
-  const count = document.getElementById('count');
-  const totalSizeEl = document.getElementById('totalSize');
+  const mgrSel = els.mgr;
 
   // Only populate dropdown if it's empty or data has changed
   if (mgrSel.options.length <= 1) {
     populateManagerDropdown();
   }
 
-  let state = { q: q.value.trim(), mgr: mgrSel.value };
-
-  function matches(row){
-    if (state.mgr && row.manager !== state.mgr) return false;
-    if (!state.q) return true;
-    const needle = state.q.toLowerCase();
-    return (row.name||"").toLowerCase().includes(needle)
-        || (row.version||"").toLowerCase().includes(needle)
-        || (row.source||"").toLowerCase().includes(needle)
-        || (row.path||"").toLowerCase().includes(needle)
-        || (row.manager||"").toLowerCase().includes(needle);
+  const q = els.q.value.trim();
+  const key = `${dataVersion}|${q}|${mgrSel.value}`;
+  if (packageWorker && _pkgCache.key !== key) {
+    workerRequest({type: 'filter', q, mgr: mgrSel.value}).then(res => {
+      if (!res) return showPackages(filteredPackages());
+      // Ignore replies overtaken by newer input or data
+      if (key !== `${dataVersion}|${els.q.value.trim()}|${mgrSel.value}`) return;
+      _pkgCache.key = key;
+      _pkgCache.rows = Array.from(res.indices, i => data[i]);
+      _pkgCache.totalSize = res.totalSize;
+      showPackages(_pkgCache);
+    });
+    return;
   }
+  showPackages(filteredPackages());
+}
 
-  tbody.innerHTML = "";
-  const filtered = data.filter(matches);
-  
-  for (const r of filtered){
-    const tr = document.createElement('tr');
-    tr.innerHTML = `
-      <td><span class="pill">${esc(r.manager||"")}</span></td>
-      <td>${esc(r.name||"")}</td>
-      <td>${esc(r.version||"")}</td>
-      <td class="size-cell">${esc(r.size_formatted||"0 B")}</td>
-      <td class="muted">${esc(r.path||"")}</td>
-      <td class="muted">${esc(r.source||"")}</td>
-      <td>
-        <button class="uninstall-btn" onclick="uninstallPackage('${esc(r.manager)}', '${esc(r.name)}')">
-          Uninstall
-        </button>
-        <button class="verify-btn" onclick="verifyPackage('${esc(r.manager)}', '${esc(r.name)}')" id="verify-${esc(r.manager)}-${esc(r.name)}">
-          Verify
-        </button>
-      </td>
-    `;
-    tbody.appendChild(tr);
-  }
-  
-  count.textContent = `${filtered.length} / ${data.length} packages`;
-  const totalSize = calculateTotalSize(filtered);
-  totalSizeEl.textContent = `Total size: ${formatSize(totalSize)}`;
+function renderPackageRow(r) {
+  const tr = cloneRow(els.pkgRowTpl);
+  const c = tr.children;
+  c[0].firstChild.textContent = r.manager || "";
+  c[1].textContent = r.name || "";
+  c[2].textContent = r.version || "";
+  c[3].textContent = r.size_formatted || "0 B";
+  c[4].textContent = c[4].title = r.path || "";
+  c[5].textContent = r.source || "";
+  tr.dataset.manager = r.manager;
+  tr.dataset.name = r.name;
+  return tr;
+}
+
+const pkgTable = createVirtualTable(els.pkgTbody, renderPackageRow);
+
+// One click listener per tbody handles every row's buttons; rows only carry
+// data-manager/data-name and each button its data-action.
+function delegateRowActions(tbody, actions) {
+  tbody.addEventListener('click', e => {
+    const btn = e.target.closest('button[data-action]');
+    if (!btn) return;
+    const tr = btn.closest('tr');
+    const action = actions[btn.dataset.action];
+    if (tr && action) action(tr.dataset.manager, tr.dataset.name, btn);
+  });
 }
 
+delegateRowActions(els.pkgTbody, {
+  uninstall: (manager, name) => uninstallPackage(manager, name),
+  verify: (manager, name, btn) => verifyPackage(manager, name, btn),
+});
+delegateRowActions(els.verificationTbody, {
+  verify: (manager, name) => verifyPackageForTab(manager, name).then(() => {
+    if (verificationFilterActive()) renderVerification();
+  }),
+});
+
 function renderHistory() {
-  const searchInput = document.getElementById('historySearch');
-  const sourceFilter = document.getElementById('historySourceFilter');
-  const tbody = document.querySelector('#historyTable tbody');
-  const count = document.getElementById('historyCount');
+  const searchInput = els.historySearch;
+  const sourceFilter = els.historySourceFilter;
+  const count = els.historyCount;
   
   const searchTerm = searchInput.value.trim().toLowerCase();
   const sourceFilterValue = sourceFilter.value;
   
-  const filtered = history.filter(item => {
+  const key = `${historyVersion}|${searchTerm}|${sourceFilterValue}`;
+  const {rows: filtered} = memoFilter(_historyCache, key, () => history.filter(item => {
     // Apply search filter
     if (searchTerm) {
-      const matches = item.name.toLowerCase().includes(searchTerm) ||
-                     item.manager.toLowerCase().includes(searchTerm) ||
-                     (item.source || '').toLowerCase().includes(searchTerm);
-      if (!matches) return false;
+      if (!item._searchBlob.includes(searchTerm)) return false;
     }
     
     // Apply source filter
     if (sourceFilterValue && item.source !== sourceFilterValue) return false;
     
     return true;
-  });
+  }));
   
-  tbody.innerHTML = "";
-  for (const item of filtered) {
-    const sourceIcon = item.source === 'dashboard_uninstall' ? '🖥️' : '🔍';
-    const sourceText = item.source === 'dashboard_uninstall' ? 'Dashboard' : 'Detected';
-    
-    const tr = document.createElement('tr');
-    tr.innerHTML = `
-      <td>${esc(item.name)}</td>
-      <td>${esc(item.version)}</td>
-      <td><span class="pill">${esc(item.manager)}</span></td>
-      <td class="size-cell">${formatSize(item.size || 0)}</td>
-      <td><span class="pill">${sourceIcon} ${sourceText}</span></td>
-      <td class="muted">${formatDate(item.uninstalled_at)}</td>
-    `;
-    tbody.appendChild(tr);
-  }
+  historyTable.setRows(filtered);
   
   count.textContent = `${filtered.length} / ${history.length} entries`;
 }
 
+function renderHistoryRow(item) {
+  const sourceIcon = item.source === 'dashboard_uninstall' ? '🖥️' : '🔍';
+  const sourceText = item.source === 'dashboard_uninstall' ? 'Dashboard' : 'Detected';
+  
+  const tr = cloneRow(els.historyRowTpl);
+  const c = tr.children;
+  c[0].textContent = item.name || "";
+  c[1].textContent = item.version || "";
+  c[2].firstChild.textContent = item.manager || "";
+  c[3].textContent = formatSize(item.size || 0);
+  c[4].firstChild.textContent = `${sourceIcon} ${sourceText}`;
+  c[5].textContent = formatDate(item.uninstalled_at);
+  return tr;
+}
+
+const historyTable = createVirtualTable(els.historyTbody, renderHistoryRow);
+
+const TAB_RENDERERS = {
+  packages: renderPackages,
+  verification: renderVerification,
+  history: renderHistory,
+  conflicts: renderConflicts,
+};
+
+function renderIfVisible(name) {
+  if (name === activeTab) {
+    staleTabs.delete(name);
+    TAB_RENDERERS[name]();
+  } else {
+    staleTabs.add(name);
+  }
+}
+
 // Tab switching
 document.querySelectorAll('.tab').forEach(tab => {
   tab.addEventListener('click', () => {
@@ -1328,42 +2272,64 @@ document.querySelectorAll('.tab').forEach(tab => {
     document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
     
     tab.classList.add('active');
-    const tabId = tab.dataset.tab + '-tab';
-    document.getElementById(tabId).classList.add('active');
+    activeTab = tab.dataset.tab;
+    document.getElementById(activeTab + '-tab').classList.add('active');
+    
+    if (staleTabs.has(activeTab)) {
+      renderIfVisible(activeTab);
+    } else {
+      // Rows rendered while the tab was hidden used an estimated height
+      const table = {packages: pkgTable, verification: verificationTable, history: historyTable}[activeTab];
+      if (table) table.render(true);
+    }
   });
 });
 
 // Event listeners
-document.getElementById('q').addEventListener('input', renderPackages);
-document.getElementById('mgr').addEventListener('change', renderPackages);
-document.getElementById('historySearch').addEventListener('input', renderHistory);
-document.getElementById('historySourceFilter').addEventListener('change', renderHistory);
-document.getElementById('verificationSearch').addEventListener('input', renderVerification);
-document.getElementById('verificationFilter').addEventListener('change', renderVerification);
-
-document.getElementById('refreshBtn').addEventListener('click', async () => {
+// Search boxes re-render once typing pauses rather than on every keystroke;
+// Enter skips the wait.
+const SEARCH_DEBOUNCE_MS = 250;
+function bindSearch(id, render) {
+  const input = els[id];
+  const debounced = debounce(render, SEARCH_DEBOUNCE_MS);
+  input.addEventListener('input', () => debounced());
+  input.addEventListener('keydown', e => {
+    if (e.key === 'Enter') {
+      debounced.cancel();
+      render();
+    }
+  });
+}
+bindSearch('q', renderPackages);
+els.mgr.addEventListener('change', renderPackages);
+bindSearch('historySearch', renderHistory);
+els.historySourceFilter.addEventListener('change', renderHistory);
+bindSearch('verificationSearch', renderVerification);
+els.verificationFilter.addEventListener('change', renderVerification);
+
+els.refreshBtn.addEventListener('click', async () => {
   await loadData();
   populateManagerDropdown(); // Refresh dropdown options
-  renderPackages();
+  renderIfVisible('packages');
 });
 
-document.getElementById('clearHistory').addEventListener('click', async () => {
+els.clearHistory.addEventListener('click', async () => {
   if (confirm('Are you sure you want to clear all uninstall history?')) {
     try {
       await fetch('/api/clear-history', {method: 'POST'});
       await loadHistory();
-      renderHistory();
+      renderIfVisible('history');
     } catch (e) {
       alert('Failed to clear history: ' + e.message);
     }
   }
 });
 
-document.getElementById('verifyAllBtn').addEventListener('click', verifyAllPackages);
-document.getElementById('refreshVerification').addEventListener('click', renderVerification);
+els.verifyAllBtn.addEventListener('click', verifyAllPackages);
+els.refreshVerification.addEventListener('click', renderVerification);
 
-document.getElementById('detectMissingBtn').addEventListener('click', async () => {
-  const btn = document.getElementById('detectMissingBtn');
+els.detectMissingBtn.addEventListener('click', async () => {
+  const btn = els.detectMissingBtn;
   btn.textContent = 'Detecting...';
   btn.disabled = true;
   
@@ -1375,7 +2341,7 @@ document.getElementById('detectMissingBtn').addEventListener('click', async () =
       if (result.missing_count > 0) {
         alert(`Detected ${result.missing_count} packages that were uninstalled outside the dashboard!`);
         await loadHistory();
-        renderHistory();
+        renderIfVisible('history');
       } else {
         alert('No missing packages detected.');
       }
@@ -1393,24 +2359,79 @@ document.getElementById('detectMissingBtn').addEventListener('click', async () =
 // Conflicts handling
 let conflicts = [];
 
-async function loadConflicts() {
+// force re-runs the checks; otherwise the server may answer from its cache
+async function loadConflicts(force = false) {
+  let result = {success: false};
   try {
-    const response = await fetch('/api/conflicts');
-    const result = await response.json();
-    if (result.success) {
-      conflicts = result.conflicts;
-    } else {
-      conflicts = [];
-    }
+    const response = await fetch(force ? '/api/conflicts?force=1' : '/api/conflicts');
+    result = await response.json();
   } catch (e) {
     console.error('Failed to load conflicts:', e);
-    conflicts = [];
   }
+  applyConflicts(result);
+}
+
+function applyConflicts(result) {
+  conflicts = result.success ? result.conflicts : [];
+  staleTabs.add('conflicts');
+}
+
+// The page-load state that is cheap to produce, fetched in one request
+const BULK_APPLY = {
+  history: result => applyHistory(result.success ? result.history : []),
+  verification_status: applyVerificationStatus,
+};
+
+async function loadBulk(names) {
+  let responses = {};
+  try {
+    const response = await fetch('/api/bulk', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({requests: names})
+    });
+    const result = await response.json();
+    if (result.success) responses = result.responses;
+  } catch (e) {
+    console.error('Failed to load dashboard state:', e);
+  }
+  for (const name of names) BULK_APPLY[name](responses[name] || {success: false});
+}
+
+// Inner markup for one conflict card, escaped once and cached on the conflict
+// object; the cache goes away with the array when conflicts are reloaded.
+function conflictHtml(conflict) {
+  let packagesHtml = '';
+  if (conflict.packages) {
+    packagesHtml = '<div style="margin-top:8px;"><strong>Packages:</strong><ul style="margin:4px 0;padding-left:20px;">';
+    for (const pkg of conflict.packages) {
+      packagesHtml += `<li>${esc(pkg.name)} (${esc(pkg.manager)}) - ${esc(pkg.version)}</li>`;
+    }
+    packagesHtml += '</ul></div>';
+  }
+  
+  let detailsHtml = '';
+  if (conflict.details) {
+    detailsHtml = `<div style="margin-top:8px;"><strong>Details:</strong><pre style="background:var(--bg);padding:8px;border-radius:4px;font-size:.85rem;overflow:auto;">${esc(conflict.details)}</pre></div>`;
+  }
+  
+  return `
+    <div style="display:flex;justify-content:space-between;align-items:start;">
+      <div>
+        <h4 style="margin:0 0 4px 0;">${esc(conflict.title)}</h4>
+        <p style="margin:0;color:var(--muted);">${esc(conflict.description)}</p>
+        ${packagesHtml}
+        ${detailsHtml}
+        <div style="margin-top:8px;"><strong>Suggestion:</strong> ${esc(conflict.suggestion)}</div>
+      </div>
+      <span class="severity-badge ${esc(conflict.severity)}">${esc(conflict.severity)}</span>
+    </div>
+  `;
 }
 
 function renderConflicts() {
-  const conflictsList = document.getElementById('conflictsList');
-  const count = document.getElementById('conflictsCount');
+  const conflictsList = els.conflictsList;
+  const count = els.conflictsCount;
   
   if (conflicts.length === 0) {
     conflictsList.innerHTML = '<div class="muted" style="text-align:center;padding:40px;">No conflicts detected! 🎉</div>';
@@ -1418,79 +2439,45 @@ function renderConflicts() {
     return;
   }
   
-  conflictsList.innerHTML = '';
+  // Cards have no listeners, so the whole list is one string and one innerHTML swap
+  const parts = [];
   for (const conflict of conflicts) {
-    const div = document.createElement('div');
-    div.className = `conflict-item ${conflict.severity}`;
-    
-    let packagesHtml = '';
-    if (conflict.packages) {
-      packagesHtml = '<div style="margin-top:8px;"><strong>Packages:</strong><ul style="margin:4px 0;padding-left:20px;">';
-      for (const pkg of conflict.packages) {
-        packagesHtml += `<li>${pkg.name} (${pkg.manager}) - ${pkg.version}</li>`;
-      }
-      packagesHtml += '</ul></div>';
-    }
-    
-    let detailsHtml = '';
-    if (conflict.details) {
-      detailsHtml = `<div style="margin-top:8px;"><strong>Details:</strong><pre style="background:var(--bg);padding:8px;border-radius:4px;font-size:.85rem;overflow:auto;">${esc(conflict.details)}</pre></div>`;
-    }
-    
-    div.innerHTML = `
-      <div style="display:flex;justify-content:space-between;align-items:start;">
-        <div>
-          <h4 style="margin:0 0 4px 0;">${esc(conflict.title)}</h4>
-          <p style="margin:0;color:var(--muted);">${esc(conflict.description)}</p>
-          ${packagesHtml}
-          ${detailsHtml}
-          <div style="margin-top:8px;"><strong>Suggestion:</strong> ${esc(conflict.suggestion)}</div>
-        </div>
-        <span class="severity-badge ${conflict.severity}">${conflict.severity}</span>
-      </div>
-    `;
-    
-    conflictsList.appendChild(div);
+    parts.push(`<div class="conflict-item ${esc(conflict.severity)}">`,
+               conflict._html ||= conflictHtml(conflict), '</div>');
   }
+  conflictsList.innerHTML = parts.join('');
   
   count.textContent = `${conflicts.length} conflicts found`;
 }
 
-document.getElementById('scanConflicts').addEventListener('click', async () => {
-  await loadConflicts();
-  renderConflicts();
+els.scanConflicts.addEventListener('click', async () => {
+  await loadConflicts(true);
+  renderIfVisible('conflicts');
 });
 
-document.getElementById('refreshConflicts').addEventListener('click', async () => {
-  await loadConflicts();
-  renderConflicts();
+els.refreshConflicts.addEventListener('click', async () => {
+  await loadConflicts(true);
+  renderIfVisible('conflicts');
 });
 
 // CSV export
-document.getElementById('exportCsv').addEventListener('click', ()=>{
-  const state = { 
-    q: document.getElementById('q').value.trim(), 
-    mgr: document.getElementById('mgr').value 
-  };
-  
-  function matches(row){
-    if (state.mgr && row.manager !== state.mgr) return false;
-    if (!state.q) return true;
-    const needle = state.q.toLowerCase();
-    return (row.name||"").toLowerCase().includes(needle)
-        || (row.version||"").toLowerCase().includes(needle)
-        || (row.source||"").toLowerCase().includes(needle)
-        || (row.path||"").toLowerCase().includes(needle)
-        || (row.manager||"").toLowerCase().includes(needle);
-  }
-  
-  const rows = data.filter(matches);
-  const cols = ["manager","name","version","size_formatted","path","source"];
-  let csv = cols.join(",") + "\\n";
+function buildCsvBlob(rows) {
+  const cols = CSV_COLS;
+  // One Blob part per line rather than one ever-growing string
+  const parts = [cols.join(",") + "\\n"];
   for (const r of rows){
-    csv += cols.map(c => `"${String(r[c]||"").replace(/"/g,'""')}"`).join(",") + "\\n";
+    parts.push(cols.map(c => `"${String(r[c]||"").replace(/"/g,'""')}"`).join(",") + "\\n");
   }
-  const blob = new Blob([csv], {type:"text/csv"});
+  return new Blob(parts, {type:"text/csv"});
+}
+
+els.exportCsv.addEventListener('click', async ()=>{
+  const res = await workerRequest({
+    type: 'csv', cols: CSV_COLS,
+    q: els.q.value.trim(),
+    mgr: els.mgr.value
+  });
+  const blob = res ? res.blob : buildCsvBlob(filteredPackages().rows);
   const url = URL.createObjectURL(blob);
   const a = document.createElement('a');
   a.href = url; a.download = "packages.csv";
@@ -1505,36 +2492,130 @@ document.querySelectorAll('th[data-k]').forEach(th => {
   th.addEventListener('click', () => {
     const k = th.dataset.k;
     if (k === sortKey) sortDir *= -1; else { sortKey = k; sortDir = 1; }
-    data.sort((a,b)=>{
-      const va = (a[sortKey]||"").toLowerCase();
-      const vb = (b[sortKey]||"").toLowerCase();
-      if (va < vb) return -1*sortDir;
-      if (va > vb) return 1*sortDir;
-      return 0;
+    const key = sortKey, dir = sortDir;
+    // The worker sorts its copy and returns the permutation to apply to data
+    workerRequest({type: 'sort', key, dir}).then(res => {
+      if (res) {
+        const old = data;
+        data = Array.from(res.order, i => old[i]);
+      } else {
+        data.sort((a,b)=>{
+          const ka = a._lc[key], kb = b._lc[key];
+          return ka < kb ? -dir : ka > kb ? dir : 0;
+        });
+      }
+      dataByManager = groupByManager(data);
+      dataVersion++;
+      staleTabs.add('verification'); // its rows follow data's order
+      renderPackages();
     });
-    renderPackages();
   });
 });
 
 // Initialize
 (async function(){
-  await loadData();
-  await loadHistory();
-  await loadVerificationStatus();
-  await loadConflicts();
-  renderPackages();
-  renderHistory();
-  renderConflicts();
-  renderVerification();
+  // Start every fetch before awaiting any of them
+  const dataLoaded = loadData();
+  // Conflicts run pip check / brew doctor, so they get their own request
+  const loads = [dataLoaded, loadBulk(['history', 'verification_status']), loadConflicts()];
+  await dataLoaded;
+  renderIfVisible(activeTab);
+  await Promise.all(loads);
+  // Hidden tabs stay stale until opened
+  if (staleTabs.has(activeTab)) renderIfVisible(activeTab);
 })();
 </script>
 </body>
 </html>
 """
 
+def api_conflicts(force=False):
+    """Response body for /api/conflicts."""
+    try:
+        return {"success": True, "conflicts": detect_package_conflicts(force)}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
+
+def api_detect_missing():
+    """Response body for /api/detect-missing; records what it finds in the history."""
+    try:
+        # The first call after startup reports what main() already found (and
+        # recorded); running the detection again would only compare the
+        # snapshot main() just wrote with itself.
+        missing_packages = DashboardHandler.take_initial_missing()
+        if missing_packages is None:
+            missing_packages = detect_missing_packages(_load_json_cached(DATA_PATH, []))
+            add_missing_packages_to_history(missing_packages)
+        return {
+            "success": True,
+            "missing_count": len(missing_packages),
+            "missing_packages": missing_packages
+        }
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
+
+def api_verification_status():
+    """Response body for /api/verification-status."""
+    try:
+        return {"success": True, "verification_status": load_verification_status()}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
+
+def api_history():
+    """Response body for the "history" part of /api/bulk."""
+    try:
+        return {"success": True, "history": load_uninstall_history()}
+    except Exception as e:
+        return {"success": False, "message": f"Error: {str(e)}"}
+
+# What /api/bulk can combine: cheap reads of cached state files, so the
+# combined response never waits on a package manager
+BULK_API = {
+    "history": api_history,
+    "verification_status": api_verification_status,
+}
+
+# Identical on every API response, so encode them once
+_CORS_HEADERS = (b"Access-Control-Allow-Origin: *\r\n"
+                 b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                 b"Access-Control-Allow-Headers: Content-Type\r\n")
+_PREFLIGHT_RESPONSE = (b"HTTP/1.1 204 No Content\r\n" + _CORS_HEADERS +
+                       b"Access-Control-Max-Age: 86400\r\nContent-Length: 0\r\n\r\n")
+
+# Fixed API responses, encoded once
+_RESP_MISSING_FIELDS = _dumps({"success": False, "message": "Missing manager or name"}, indent=False)
+_RESP_HISTORY_CLEARED = _dumps({"success": True, "message": "History cleared"}, indent=False)
+_RESP_VERIFICATION_SAVED = _dumps({"success": True, "message": "Verification status saved"}, indent=False)
+_PENDING_RESULT = {"status": "pending", "message": "Verification in progress"}
+_RESP_VERIFY_PENDING = _dumps({"success": True, "pending": True, "result": _PENDING_RESULT},
+                              indent=False)
+
 class DashboardHandler(SimpleHTTPRequestHandler):
+    # Keep-alive connections; every response carries a Content-Length
+    protocol_version = "HTTP/1.1"
+    # Buffer wfile so the status line, headers and body leave in one send();
+    # handle_one_request() flushes it after each response
+    wbufsize = 64 * 1024
+    # Idle keep-alive connections are closed after this many seconds; each
+    # one holds a pool worker meanwhile
+    timeout = 5
+    # Small JSON responses must not wait on Nagle for the client's ACK
+    disable_nagle_algorithm = True
+    # Missing packages found by main() at startup, handed to the first
+    # detect-missing request
+    initial_missing = None
+    _initial_missing_lock = threading.Lock()
+
+    @classmethod
+    def take_initial_missing(cls):
+        """Return initial_missing once, then None."""
+        with cls._initial_missing_lock:
+            missing, cls.initial_missing = cls.initial_missing, None
+        return missing
+
     def do_POST(self):
         """Handle API requests."""
+        self._body_pending = True
         parsed_path = urlparse(self.path)
         
         if parsed_path.path == '/api/uninstall':
@@ -1543,6 +2624,8 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.handle_clear_history()
         elif parsed_path.path == '/api/verify':
             self.handle_verify()
+        elif parsed_path.path == '/api/verify-batch':
+            self.handle_verify_batch()
         elif parsed_path.path == '/api/conflicts':
             self.handle_conflicts()
         elif parsed_path.path == '/api/detect-missing':
@@ -1551,8 +2634,24 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.handle_verification_status()
         elif parsed_path.path == '/api/save-verification-status':
             self.handle_save_verification_status()
+        elif parsed_path.path == '/api/bulk':
+            self.handle_bulk()
         else:
             self.send_error(404)
+        self._discard_body()
+    
+    def do_OPTIONS(self):
+        """Answer CORS preflight requests with a prebuilt response."""
+        if self.server.saturated():
+            # Build it normally, so end_headers can close the connection
+            self.send_response(204)
+            self._headers_buffer.append(_CORS_HEADERS)
+            self.send_header('Access-Control-Max-Age', '86400')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.log_request(204)
+        self.wfile.write(_PREFLIGHT_RESPONSE)
     
     def do_GET(self):
         """Handle GET requests."""
@@ -1560,29 +2659,37 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         
         if parsed_path.path == '/api/conflicts':
             self.handle_conflicts()
+        elif parsed_path.path == '/api/verification-status':
+            self.handle_verification_status()
         else:
             # Default to serving static files
             super().do_GET()
-    
+
+    def send_head(self):
+        # The ".hash" sidecars of _write_bytes_atomic share OUT_DIR with the
+        # served files but aren't part of the dashboard (GET and HEAD both
+        # come through here)
+        if self.translate_path(self.path).lower().endswith('.hash'):
+            self.send_error(404)
+            return None
+        return super().send_head()
+
     def handle_uninstall(self):
         """Handle package uninstall request."""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = _loads(self._read_body())
             
             manager = data.get('manager')
             name = data.get('name')
             
             if not manager or not name:
-                self.send_json_response({"success": False, "message": "Missing manager or name"})
+                self.send_raw(_RESP_MISSING_FIELDS)
                 return
             
             # Find the package in current data to get its info
             current_data = []
             try:
-                if DATA_PATH.exists():
-                    current_data = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+                current_data = _load_json_cached(DATA_PATH, [])
             except Exception:
                 pass
             
@@ -1594,6 +2701,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             
             # Perform uninstall
             result = uninstall_package(manager, name)
+            forget_verification(manager, name)
             
             if result["success"] and package_info:
                 # Add to history
@@ -1608,96 +2716,229 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         """Handle clear history request."""
         try:
             save_uninstall_history([])
-            self.send_json_response({"success": True, "message": "History cleared"})
+            self.send_raw(_RESP_HISTORY_CLEARED)
         except Exception as e:
             self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
     
     def handle_verify(self):
         """Handle package verification request."""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = _loads(self._read_body())
             
             manager = data.get('manager')
             name = data.get('name')
             
             if not manager or not name:
-                self.send_json_response({"success": False, "message": "Missing manager or name"})
+                self.send_raw(_RESP_MISSING_FIELDS)
                 return
             
-            result = verify_package_integrity(manager, name)
+            result = request_verification(manager, name)
+            if result is None:
+                self.send_raw(_RESP_VERIFY_PENDING)
+                return
             self.send_json_response({"success": True, "result": result})
             
         except Exception as e:
             self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
     
-    def handle_conflicts(self):
-        """Handle package conflicts detection request."""
+    def handle_verify_batch(self):
+        """Handle a request to verify many packages in one round-trip."""
         try:
-            conflicts = detect_package_conflicts()
-            self.send_json_response({"success": True, "conflicts": conflicts})
-        except Exception as e:
-            self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
-    
-    def handle_detect_missing(self):
-        """Handle missing packages detection request."""
-        try:
-            # Load current packages
-            current_packages = []
-            if DATA_PATH.exists():
-                current_packages = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+            data = _loads(self._read_body())
             
-            # Detect missing packages
-            missing_packages = detect_missing_packages(current_packages)
+            packages = [(p.get('manager'), p.get('name')) for p in data.get('packages') or []
+                        if isinstance(p, dict) and p.get('manager') and p.get('name')]
             
-            # Add them to history
-            add_missing_packages_to_history(missing_packages)
+            results = verify_packages(packages)
+            self.send_json_response({"success": True, "results": [
+                {"manager": manager, "name": name, "result": result} if result is not None else
+                {"manager": manager, "name": name, "pending": True, "result": _PENDING_RESULT}
+                for (manager, name), result in zip(packages, results)
+            ]})
             
-            self.send_json_response({
-                "success": True, 
-                "missing_count": len(missing_packages),
-                "missing_packages": missing_packages
-            })
         except Exception as e:
             self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
     
+    def handle_conflicts(self):
+        """Handle package conflicts detection request; ?force=1 rescans."""
+        query = parse_qs(urlparse(self.path).query)
+        self.send_json_response(api_conflicts(force=query.get('force') == ['1']))
+    
+    def handle_detect_missing(self):
+        """Handle missing packages detection request."""
+        self.send_json_response(api_detect_missing())
+    
     def handle_verification_status(self):
         """Handle verification status request."""
+        self.send_json_response(api_verification_status())
+    
+    def handle_bulk(self):
+        """Handle several read-only API requests in one round-trip.
+
+        The body is {"requests": [name, ...]} with names from BULK_API. They
+        are cheap, so they run right here, one after another.
+        """
         try:
-            verification_data = load_verification_status()
-            self.send_json_response({"success": True, "verification_status": verification_data})
+            data = _loads(self._read_body())
+            
+            names = [n for n in data.get('requests') or [] if n in BULK_API]
+            self.send_json_response({"success": True, "responses": {
+                n: BULK_API[n]() for n in dict.fromkeys(names)
+            }})
+            
         except Exception as e:
             self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
     
     def handle_save_verification_status(self):
         """Handle save verification status request."""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            verification_data = json.loads(post_data.decode('utf-8'))
+            verification_data = _loads(self._read_body())
             
             save_verification_status(verification_data)
-            self.send_json_response({"success": True, "message": "Verification status saved"})
+            self.send_raw(_RESP_VERIFICATION_SAVED)
         except Exception as e:
             self.send_json_response({"success": False, "message": f"Error: {str(e)}"})
     
 
     
+    _body_buffers = threading.local()
+    # Larger bodies get a one-off buffer, so one big upload doesn't pin its
+    # size on a worker thread for good
+    body_buffer_limit = 64 * 1024
+
+    def _content_length(self):
+        """Return the request's Content-Length, or 0 if absent or malformed."""
+        cl = self.headers.get('Content-Length')
+        try:
+            n = int(cl) if cl else 0
+        except ValueError:
+            n = -1
+        if n < 0:
+            # Where this body ends is unknown, so the connection can't be reused
+            self.close_connection = True
+            return 0
+        return n
+
+    # Bodies up to this size are skipped to keep the connection; larger ones close it
+    discard_limit = 1024 * 1024
+
+    def _discard_body(self):
+        """Skip a request body that no handler read.
+
+        On a keep-alive connection the next request would otherwise be parsed
+        from the leftover bytes.
+        """
+        if not getattr(self, '_body_pending', False):
+            return
+        self._body_pending = False
+        if self.headers.get('Transfer-Encoding'):
+            self.close_connection = True
+            return
+        n = self._content_length()
+        if n > self.discard_limit:
+            self.close_connection = True
+            return
+        while n > 0:
+            chunk = self.rfile.read(min(n, 64 * 1024))
+            if not chunk:
+                break
+            n -= len(chunk)
+
+    def _read_body(self):
+        """Read the request body into this thread's reusable buffer.
+
+        Returns a memoryview that is only valid until the thread's next
+        request, so parse it right away (orjson reads it without copying).
+        """
+        self._body_pending = False
+        n = self._content_length()
+        if n > self.body_buffer_limit:
+            buf = bytearray(n)
+        else:
+            buf = getattr(self._body_buffers, 'buf', None)
+            if buf is None:
+                buf = self._body_buffers.buf = bytearray(self.body_buffer_limit)
+        view = memoryview(buf)[:n]
+        got = 0
+        while got < n:
+            chunk = self.rfile.readinto(view[got:])
+            if not chunk:
+                break
+            got += chunk
+        return view[:got]
+
+    def end_headers(self):
+        # With every worker busy, new connections queue up behind idle
+        # keep-alive ones; close this one after the response instead
+        if not self.close_connection and self.server.saturated():
+            self.send_header('Connection', 'close')
+        super().end_headers()
+
     def send_json_response(self, data):
         """Send JSON response."""
+        self.send_raw(_dumps(data, indent=False))
+    
+    def send_raw(self, body):
+        """Send an already encoded JSON body."""
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', str(len(body)))
+        # Where send_header() puts its encoded lines; the CORS block is pre-encoded
+        self._headers_buffer.append(_CORS_HEADERS)
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
+        self.wfile.write(body)
+    
+    def copyfile(self, source, outputfile):
+        """Send static files (index.html, packages.json, ...) with socket.sendfile().
+
+        This uses sendfile(2) where the OS supports it, so large files such as
+        packages.json go from the page cache to the socket without being read
+        into Python; socket.sendfile() itself falls back to plain sends.
+        """
+        if outputfile is self.wfile:
+            self.wfile.flush()
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
     
     def log_message(self, *args, **kwargs):
         # keep console quiet
         pass
 
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that reuses a bounded pool of worker threads.
+
+    Connections are handled by ThreadingMixIn.process_request_thread as usual,
+    just on pooled (daemon) threads instead of a new thread per connection.
+    """
+    max_workers = 16
+    request_queue_size = 128
+    send_buffer_size = 256 * 1024
+
+    def __init__(self, *args, **kwargs):
+        # Before super().__init__, which calls server_close() if binding fails
+        self._pool = DaemonThreadPool(self.max_workers, "pkglens-http")
+        super().__init__(*args, **kwargs)
+
+    def saturated(self):
+        """True when no worker is free for the next connection."""
+        return self._pool.saturated()
+
+    def server_bind(self):
+        # Accepted sockets inherit the listening socket's buffer size
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        except OSError:
+            pass
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown()
+
 def serve_dir(directory: Path, port: int):
     os.chdir(str(directory))
     if port == 0:
@@ -1705,9 +2946,7 @@ def serve_dir(directory: Path, port: int):
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.bind(('', 0))
             port = s.getsockname()[1]
-    httpd = ThreadingHTTPServer(("127.0.0.1", port), DashboardHandler)
-    t = threading.Thread(target=httpd.serve_forever, daemon=True)
-    t.start()
+    httpd = PooledHTTPServer(("127.0.0.1", port), DashboardHandler)
     return httpd, port
 
 def main():
@@ -1716,6 +2955,8 @@ def main():
     ap.add_argument("--port", type=int, default=8008, help="Port to serve on (0 = auto-pick)")
     args = ap.parse_args()
 
+    migrate_legacy_history()
+
     # 1) Collect
     items = collect_all()
     
@@ -1726,19 +2967,15 @@ def main():
         add_missing_packages_to_history(missing_packages)
     
     # 3) Write assets
-    DATA_PATH.write_text(json.dumps(items, indent=2), encoding="utf-8")
-    HTML_PATH.write_text(HTML_TEMPLATE, encoding="utf-8")
+    _write_json_atomic(DATA_PATH, items)
+    _write_bytes_atomic(HTML_PATH, HTML_TEMPLATE.encode("utf-8"))
     
     # Save current packages as snapshot for next comparison
     save_packages_snapshot(items)
     
-    # Initialize history file if it doesn't exist
-    if not HISTORY_PATH.exists():
-        HISTORY_PATH.write_text("[]", encoding="utf-8")
-    
-    # Initialize verification status file if it doesn't exist
-    if not VERIFICATION_STATUS_PATH.exists():
-        VERIFICATION_STATUS_PATH.write_text("{}", encoding="utf-8")
+    # Initialize history and verification status files if they don't exist
+    _init_if_missing(HISTORY_PATH, b"")
+    _init_if_missing(VERIFICATION_STATUS_PATH, b"{}")
 
     print(f"[+] Wrote data:   {DATA_PATH}")
     print(f"[+] Wrote HTML:   {HTML_PATH}")
@@ -1748,22 +2985,22 @@ def main():
         print(f"[+] Added {len(missing_packages)} missing packages to history")
 
     # 3) Serve locally
+    DashboardHandler.initial_missing = missing_packages
     httpd, port = serve_dir(OUT_DIR, args.port)
     url = f"http://127.0.0.1:{port}/index.html"
     print(f"[+] Serving dashboard at {url}")
 
     if args.open:
-        # Give the server a tick to start
-        time.sleep(0.2)
-        webbrowser.open(url)
+        import webbrowser
+        # The socket is already listening; open once serve_forever is running
+        threading.Timer(0.2, webbrowser.open, args=(url,)).start()
 
     try:
-        # keep process alive
-        while True:
-            time.sleep(1.0)
+        httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n[!] Shutting down server...")
-        httpd.shutdown()
+    finally:
+        httpd.server_close()
 
 if __name__ == "__main__":
     main()